@@ -23,7 +23,7 @@ BASE = Path(__file__).resolve().parent.parent
 
 class KeyGenWorker(QThread):
     # Signal émis lorsque le travail est terminé
-    finished = Signal(dict, str, str, float)
+    finished = Signal(object, str, str, float)
     
     def __init__(self, n, v, m):
         super().__init__()
@@ -39,15 +39,15 @@ class KeyGenWorker(QThread):
             private_key = KeyGen(self.n, self.v, self.m)
             
             # 2. PRÉPARATION DES CLÉS PUBLIQUES ET PRIVÉES
-            public_key = {k: private_key[k] for k in ["n", "v", "m", "F", "T"]}
+            public_key = {k: private_key[k] for k in ["n", "v", "m", "P"]}
             
             # --- NOUVEAU : Création du digest de la Clé Publique ---
             pub_digest = {
                 "Parameters": f"v={self.v} (vinegar), o={self.m} (oil)",
                 "Total_N": self.n,
-                "F_Polynomes_Count": len(public_key["F"]),
-                "T_Matrice_Shape": f"{self.n}x{self.n}",
-                "F_Sample_Coefficients": public_key["F"][0]["vv"][:5], # Afficher juste 5 coefficients du premier polynôme pour l'aperçu
+                "P_Equations_Count": self.m,
+                "P_Coefficients_Per_Equation": (self.n + 1) * (self.n + 2) // 2,
+                "P_Sample_Coefficients": public_key["P"].column(0)[:5].tolist(), # Afficher juste 5 coefficients de la première équation pour l'aperçu
                 "Q_Modulus": q
             }
             # Sérialisation rapide du digest (petit dictionnaire)
@@ -308,7 +308,7 @@ QTabBar::tab:selected {
         
         self.private_key = private_key
         # La clé publique est extraite du dictionnaire privé pour la vérification
-        self.public_key = {k: self.private_key[k] for k in ["n", "v", "m", "F", "T"]}
+        self.public_key = {k: self.private_key[k] for k in ["n", "v", "m", "P"]}
         
         # Affichage du digest rapide
         self.text_pub.setPlainText(pub_text)
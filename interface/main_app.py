@@ -16,13 +16,20 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 # NOTE: Assurez-vous d'avoir le module uov disponible dans l'environnement d'exécution
 try:
     from uov import KeyGen, Sign, Verify, q
+    from uov.rng import random_bytes
+    from uov.sigfile import SALT_BYTES, save_signature, load_signature, signature_to_json
 except ImportError:
     # Fournir des stubs si uov n'est pas disponible pour la compilation (mais l'app ne fonctionnera pas réellement sans)
     print("ATTENTION: Le module 'uov' est introuvable. Les fonctions crypto ne seront pas disponibles.")
     q = 251 # Valeur par défaut
-    def KeyGen(*args, **kwargs): return {"n": 156, "v": 112, "m": 44, "F": [], "T": []}
+    def KeyGen(*args, **kwargs): return {"n": 156, "v": 112, "m": 44, "F": [], "T": [], "P": []}
     def Sign(*args, **kwargs): return list(range(156))
     def Verify(*args, **kwargs): return True
+    SALT_BYTES = 16
+    random_bytes = os.urandom
+    def save_signature(*args, **kwargs): raise RuntimeError("Module 'uov' introuvable.")
+    def load_signature(*args, **kwargs): raise RuntimeError("Module 'uov' introuvable.")
+    def signature_to_json(*args, **kwargs): raise RuntimeError("Module 'uov' introuvable.")
 
 
 BASE = Path(__file__).resolve().parent.parent
@@ -33,7 +40,7 @@ BASE = Path(__file__).resolve().parent.parent
 
 class KeyGenWorker(QThread):
     """Travailleur pour la génération de clés KeyGen"""
-    finished = Signal(dict, str, str, float)
+    finished = Signal(object, str, str, float)
     
     def __init__(self, n, v, m):
         super().__init__()
@@ -45,14 +52,14 @@ class KeyGenWorker(QThread):
         try:
             start_time = time.time()
             private_key = KeyGen(self.n, self.v, self.m)
-            public_key = {k: private_key[k] for k in ["n", "v", "m", "F", "T"]}
+            public_key = {k: private_key[k] for k in ["n", "v", "m", "P"]}
             
             pub_digest = {
                 "Paramètres": f"v={self.v} (vinegar), o={self.m} (oil)",
                 "n": self.n,
-                "Nombre de polynomes quadratiques": len(public_key["F"]),
-                "Forme de T": f"{self.n}x{self.n}",
-                "Modèle des coefficients": public_key["F"][0]["vv"][:5] if public_key["F"] else "N/A",
+                "Nombre d'équations publiques (P = F∘T)": self.m,
+                "Coefficients par équation": (self.n + 1) * (self.n + 2) // 2,
+                "Modèle des coefficients": public_key["P"].column(0)[:5].tolist() if len(public_key["P"]) else "N/A", # 5 coefficients de la première équation
                 "q": q
             }
             pub_text = json.dumps(pub_digest, indent=2)
@@ -79,18 +86,23 @@ class SignWorker(QThread):
         self.data_to_sign = data_to_sign
         self.is_file_hash = is_file_hash
         self.file_path = file_path
+        self.salt = b"" # Sel tiré pour chaque document signé, stocké dans le .sig
+        self.file_hash = None # SHA-256 du document (affichage), calculé pendant la même lecture
 
     def run(self):
         try:
-            # Si c'est un fichier, le message à signer est d'abord le hash
-            message = self.data_to_sign
-            
-            if self.is_file_hash and self.file_path:
-                # Calculer le hash du fichier (peut être long)
-                message = self._calculate_file_hash(self.file_path)
-
             start_time = time.time()
-            sigma = Sign(self.private_key, message) 
+            if self.is_file_hash and self.file_path:
+                # Le contenu du fichier est signé directement, haché au fil de la lecture
+                message = os.path.basename(self.file_path)
+                self.salt = random_bytes(SALT_BYTES)
+                sha256_hash = hashlib.sha256()
+                with open(self.file_path, "rb") as f:
+                    sigma = Sign(self.private_key, self._read_chunks(f, sha256_hash), salt=self.salt)
+                self.file_hash = sha256_hash.hexdigest()
+            else:
+                message = self.data_to_sign
+                sigma = Sign(self.private_key, message) 
             end_time = time.time()
             duration = end_time - start_time
             
@@ -100,13 +112,12 @@ class SignWorker(QThread):
             # Émettre l'échec
             self.finished.emit(False, str(e), [], 0.0, self.file_path)
 
-    def _calculate_file_hash(self, file_path):
-        """Calcule le hash SHA-256 d'un fichier (fonction utilitaire pour le worker)"""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+    @staticmethod
+    def _read_chunks(f, sha256_hash):
+        """Morceaux du fichier pour Sign, ajoutés au passage au hash SHA-256 affiché: une seule lecture."""
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256_hash.update(chunk)
+            yield chunk
 
 # ==============================================================================
 # CLASSE DE TRAVAIL EN ARRIÈRE-PLAN POUR LA VÉRIFICATION
@@ -116,50 +127,37 @@ class VerifyWorker(QThread):
     """Travailleur pour la vérification asynchrone (message ou document)"""
     finished = Signal(bool, str, float, bool) # Résultat (Valide/Invalide), message/hash, durée, est_verification_fichier
     
-    def __init__(self, public_key, data_to_verify, sigma, is_file_verification, stored_hash=None):
+    def __init__(self, public_key, data_to_verify, sigma, is_file_verification, salt=b""):
         super().__init__()
         self.public_key = public_key
         self.data_to_verify = data_to_verify # Message ou chemin du fichier
         self.sigma = sigma
         self.is_file_verification = is_file_verification
-        self.stored_hash = stored_hash # Hash attendu si vérification de fichier
+        self.salt = salt
 
     def run(self):
         try:
-            message_or_hash = self.data_to_verify
-            
             if self.is_file_verification:
-                # 1. Calculer le hash du fichier actuel
-                current_hash = self._calculate_file_hash(self.data_to_verify)
-                
-                # 2. Vérifier que le hash correspond au hash stocké dans le .sig
-                if current_hash != self.stored_hash:
-                    # Le fichier a été modifié, la vérification échoue avant l'appel à Verify
-                    self.finished.emit(False, "Le document a été modifié !", 0.0, True)
-                    return
-                
-                message_or_hash = current_hash
-            
-            # 3. Vérifier la signature
+                # Le contenu du fichier est vérifié directement, haché au fil de la lecture
+                start_time = time.time()
+                with open(self.data_to_verify, "rb") as f:
+                    ok = Verify(self.public_key, f, self.sigma, salt=self.salt)
+                duration = time.time() - start_time
+                self.finished.emit(ok, os.path.basename(self.data_to_verify), duration, True)
+                return
+
+            # Vérifier la signature du message
             start_time = time.time()
-            ok = Verify(self.public_key, message_or_hash, self.sigma)
+            ok = Verify(self.public_key, self.data_to_verify, self.sigma)
             end_time = time.time()
             duration = end_time - start_time
             
-            self.finished.emit(ok, message_or_hash, duration, self.is_file_verification)
+            self.finished.emit(ok, self.data_to_verify, duration, self.is_file_verification)
             
         except Exception as e:
             # Émettre l'échec, le message d'erreur est la raison
             self.finished.emit(False, str(e), 0.0, self.is_file_verification)
 
-    def _calculate_file_hash(self, file_path):
-        """Calcule le hash SHA-256 d'un fichier (fonction utilitaire pour le worker)"""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
-
 # ==============================================================================
 # FENÊTRE PRINCIPALE
 # ==============================================================================
@@ -401,7 +399,7 @@ QTabBar::tab:selected {
         
         if private_key:
             self.private_key = private_key
-            self.public_key = {k: self.private_key[k] for k in ["n", "v", "m", "F", "T"]}
+            self.public_key = {k: self.private_key[k] for k in ["n", "v", "m", "P"]}
             
             self.text_pub.setPlainText(pub_text)
             self.text_priv.setText(priv_text) 
@@ -533,23 +531,28 @@ QTabBar::tab:selected {
                 self, 
                 "Sauvegarder la signature", 
                 sig_file_path, 
-                "Fichiers de signature (*.sig)"
+                "Fichiers de signature (*.sig);;Export JSON (*.json)"
             )
 
             if not save_path:
                 QMessageBox.warning(self, "Annulation", "Sauvegarde de la signature annulée.")
                 return
 
-            signature_data = {
-                "file_name": os.path.basename(file_path),
-                "file_hash": file_hash_or_error, # Ici, c'est le hash du fichier
-                "signature": sigma,
-                "algorithm": "UOV",
-                "hash_algorithm": "SHA-256"
-            }
-            
-            with open(save_path, "w") as f:
-                json.dump(signature_data, f, indent=2)
+            salt = self.sign_worker.salt
+            if save_path.lower().endswith(".json"):
+                # Export JSON lisible (optionnel)
+                with open(save_path, "w") as f:
+                    f.write(signature_to_json(
+                        sigma, salt,
+                        file_name=os.path.basename(file_path),
+                        signed_content="file", # Le contenu du fichier est signé directement
+                        algorithm="UOV",
+                        hash_algorithm="SHAKE256"
+                    ))
+            else:
+                # Conteneur binaire compact: en-tête fixe, sigma (n octets) et sel
+                fingerprint = getattr(self.private_key, "fingerprint", None)
+                save_signature(save_path, sigma, salt, fingerprint)
             
             QMessageBox.information(
                 self, 
@@ -558,7 +561,8 @@ QTabBar::tab:selected {
                 f"Signature sauvegardée dans :\n{save_path}"
             )
             
-            self.label_file_hash.setText(f"Signature créée : {os.path.basename(save_path)}")
+            self.label_file_hash.setText(f"Hash SHA-256: {self.sign_worker.file_hash}\n"
+                                         f"Signature créée : {os.path.basename(save_path)}")
             
         except Exception as e:
             QMessageBox.critical(self, "Erreur de sauvegarde", f"Erreur lors de la sauvegarde du fichier signature : {e}")
@@ -700,13 +704,8 @@ QTabBar::tab:selected {
             self.label_selected_file.setText(f" {os.path.basename(file_path)}")
             self.label_selected_file.setStyleSheet("color: #4a90e2; font-weight: bold;")
             self.btn_sign_file.setEnabled(True)
-            
-            # Calculer le hash du fichier (peut être fait dans le thread principal car c'est juste un affichage)
-            try:
-                file_hash = self.calculate_file_hash(file_path)
-                self.label_file_hash.setText(f"Hash SHA-256: {file_hash[:64]}...")
-            except Exception as e:
-                self.label_file_hash.setText(f"Erreur calcul hash: {e}")
+            # Le hash est calculé par le SignWorker, pendant la lecture qui sert à la signature
+            self.label_file_hash.setText("Hash (SHA-256) du document: calculé à la signature")
         else:
             self.selected_file_path = None
             self.label_selected_file.setText("Aucun fichier sélectionné")
@@ -714,14 +713,6 @@ QTabBar::tab:selected {
             self.btn_sign_file.setEnabled(False)
             self.label_file_hash.setText("Hash (SHA-256) du document: ---")
 
-    def calculate_file_hash(self, file_path):
-        """Calcule le hash SHA-256 d'un fichier (synchrone, pour affichage immédiat)"""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
-    
     def select_file_to_verify(self):
         file_path, _ = QFileDialog.getOpenFileName(
             self, 
@@ -774,20 +765,18 @@ QTabBar::tab:selected {
             QMessageBox.warning(self, "Avertissement", "Sélectionnez le fichier et sa signature.")
             return
 
-        # 1. Charger la signature (doit être fait dans le thread principal pour accéder au FS)
+        # 1. Charger la signature (.sig binaire, ou export JSON)
         try:
-            with open(self.verify_signature_path, "r") as f:
-                signature_data = json.load(f)
-            
-            stored_hash = signature_data.get("file_hash")
-            sigma = signature_data.get("signature")
+            signature_data = load_signature(self.verify_signature_path)
+            sigma = signature_data["signature"]
+            salt = signature_data["salt"]
             
-            if not stored_hash or not sigma:
-                 QMessageBox.critical(self, "Erreur", "Fichier de signature invalide : hash ou signature manquante.")
-                 return
-            
-            if not isinstance(sigma, list) or not all(isinstance(x, int) for x in sigma):
-                 QMessageBox.critical(self, "Erreur", "La signature dans le fichier .sig n'est pas au format UOV attendu (liste d'entiers).")
+            if len(salt) != SALT_BYTES:
+                QMessageBox.critical(self, "Erreur", f"Fichier de signature invalide : le sel doit compter {SALT_BYTES} octets.")
+                return
+
+            if not sigma:
+                 QMessageBox.critical(self, "Erreur", "Fichier de signature invalide : signature manquante.")
                  return
                  
         except Exception as e:
@@ -806,7 +795,7 @@ QTabBar::tab:selected {
             data_to_verify=self.verify_file_path, 
             sigma=sigma, 
             is_file_verification=True,
-            stored_hash=stored_hash
+            salt=salt
         )
         self.verify_worker.finished.connect(self.verify_file_finished)
         self.verify_worker.start()
@@ -834,13 +823,13 @@ QTabBar::tab:selected {
                 self.label_file_verify_result.setStyleSheet("font-size: 16pt; font-weight: bold; color: red;")
                 QMessageBox.warning(self, "Document modifié", "Le fichier a été modifié depuis la signature.")
             else:
-                # Échec de la vérification crypto ou autre erreur
+                # Échec de la vérification crypto (signature fausse ou document modifié) ou autre erreur
                 self.label_file_verify_result.setText(f"Signature invalide !")
                 self.label_file_verify_result.setStyleSheet("font-size: 16pt; font-weight: bold; color: red;")
                 QMessageBox.critical(
                     self, 
                     "Signature invalide", 
-                    f" La signature n'est pas valide (Erreur: {message_or_hash}) !"
+                    f" La signature n'est pas valide ou le document a été modifié ({message_or_hash}) !"
                 )
 
 def main():
@@ -1 +1 @@
-from .uov import KeyGen, q, Sign, Verify
+from .uov import KeyGen, q, Sign, sign_many, sign_digest, OnlineSigner, Verify, verify_digest, verify_many, CachedVerifier, hash_to_target, UOVKey, SigningKey, prepare_signing_key
@@ -0,0 +1,25 @@
+import os
+
+# --- CHOIX DU MOTEUR D'ALGÈBRE LINÉAIRE GF(2^8) ---
+#
+# Les deux moteurs exposent la même interface (GFMatrix, GFVector):
+#   - "numpy": tableaux uint8 vectorisés (uov/gf_numpy.py), utilisé si NumPy est installé;
+#   - "swar":  pur Python, vecteurs bytes et XOR de grands entiers (uov/gf_swar.py).
+# La variable d'environnement UOV_BACKEND ("numpy" ou "swar") force le choix.
+
+BACKEND = os.environ.get("UOV_BACKEND", "").strip().lower()
+
+if BACKEND not in ("", "numpy", "swar"):
+    raise ValueError(f"UOV_BACKEND inconnu : {BACKEND!r} (valeurs possibles : 'numpy', 'swar').")
+
+if BACKEND in ("", "numpy"):
+    try:
+        from .gf_numpy import GFMatrix, GFVector
+        BACKEND = "numpy"
+    except ImportError:
+        if BACKEND == "numpy":
+            raise
+        BACKEND = "swar"
+
+if BACKEND == "swar":
+    from .gf_swar import GFMatrix, GFVector
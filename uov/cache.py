@@ -0,0 +1,87 @@
+import threading
+import time
+from collections import OrderedDict
+
+# --- CACHE LRU BORNÉ ---
+
+
+class LRUCache:
+    """Cache LRU de taille bornée, partageable entre threads.
+
+    Au-delà de maxsize entrées, les moins récemment utilisées sont évincées;
+    maxsize = 0 désactive le cache. Avec ttl (en secondes), une entrée expire
+    ce délai après son insertion. Les compteurs hits/misses mesurent son
+    efficacité.
+    """
+
+    def __init__(self, maxsize=128, ttl=None):
+        if maxsize < 0:
+            raise ValueError("La taille du cache doit être positive ou nulle.")
+        self.maxsize = maxsize
+        self.ttl = self._check_ttl(ttl)
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict() # clé -> (valeur, date d'expiration ou None)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _check_ttl(ttl):
+        if ttl is not None and ttl <= 0:
+            raise ValueError("La durée de vie des entrées doit être strictement positive.")
+        return ttl
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, expires = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            expires = None if self.ttl is None else time.monotonic() + self.ttl
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize):
+        if maxsize < 0:
+            raise ValueError("La taille du cache doit être positive ou nulle.")
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def set_ttl(self, ttl):
+        """Nouvelle durée de vie (None: sans expiration), pour les entrées insérées ensuite."""
+        self.ttl = self._check_ttl(ttl)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._data),
+                    "maxsize": self.maxsize, "ttl": self.ttl}
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and (entry[1] is None or entry[1] > time.monotonic())
+
+    def _evict(self):
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
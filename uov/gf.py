@@ -0,0 +1,148 @@
+import threading
+
+# --- ARITHMÉTIQUE GF(2^8) PAR TABLES PRÉCALCULÉES ---
+
+
+# Corps fini: q=256 (GF(2^8))
+q = 256
+IRREDUCIBLE_256 = 0b100011101 # Polynôme: x^8 + x^4 + x^3 + x^2 + 1
+GENERATOR = 0x02 # x est primitif pour x^8 + x^4 + x^3 + x^2 + 1
+
+# Tables construites une seule fois, au premier usage (voir _load_tables)
+_EXP = None   # Antilog: _EXP[k] = g^k, 510 entrées pour éviter le modulo 255
+_LOG = None   # Log discret: _LOG[a] pour a != 0
+_INV = None   # Inverse: _INV[a] pour a != 0 (_INV[0] = 0, jamais utilisé)
+_MUL = None   # Produit complet 256x256 (64 Kio), indexé par (a << 8) | b
+_ROWS = None  # _ROWS[c] = ligne c de _MUL (256 octets), utilisable avec bytes.translate
+
+_lock = threading.Lock()
+
+
+def _slow_mul(a, b):
+    """Multiplication bit à bit (shift/XOR), utilisée uniquement pour construire les tables."""
+    res = 0
+    for _ in range(8):
+        if b & 1:
+            res ^= a
+        a_high_bit = a & 0x80
+        a <<= 1
+        if a_high_bit:
+            a ^= IRREDUCIBLE_256
+        b >>= 1
+    return res
+
+
+def _load_tables():
+    """Construit les tables log/antilog, inverse et produit (une seule fois)."""
+    global _EXP, _LOG, _INV, _MUL, _ROWS
+    with _lock:
+        if _MUL is not None:
+            return _MUL
+
+        exp = bytearray(510)
+        log = bytearray(256)
+        x = 1
+        for k in range(255):
+            exp[k] = x
+            exp[k + 255] = x
+            log[x] = k
+            x = _slow_mul(x, GENERATOR)
+
+        inv = bytearray(256)
+        for a in range(1, 256):
+            inv[a] = exp[255 - log[a]]
+
+        mul = bytearray(256 * 256)
+        for a in range(1, 256):
+            la = log[a]
+            base = a << 8
+            for b in range(1, 256):
+                mul[base | b] = exp[la + log[b]]
+
+        mul = bytes(mul)
+        _EXP, _LOG, _INV = bytes(exp), bytes(log), bytes(inv)
+        _ROWS = [mul[c << 8:(c + 1) << 8] for c in range(256)]
+        # _MUL en dernier: sa présence signale que toutes les tables sont prêtes
+        _MUL = mul
+        return _MUL
+
+
+# --- OPÉRATIONS SCALAIRES ---
+
+def gf_add(a, b):
+    """Addition dans GF(2^k) = XOR."""
+    return a ^ b
+
+def gf_sub(a, b):
+    """Soustraction dans GF(2^k) = XOR (identique à l'addition)."""
+    return a ^ b
+
+def gf_mul(a, b):
+    """Multiplication dans GF(2^8) modulo x^8 + x^4 + x^3 + x^2 + 1 (lecture de table).
+
+    a et b sont des entiers dans [0, 255]; int() évite les débordements de
+    a << 8 sur des scalaires NumPy uint8.
+    """
+    return (_MUL or _load_tables())[(int(a) << 8) | int(b)]
+
+def gf_inv(a):
+    """Inverse multiplicatif de 'a' dans GF(2^8) (lecture de table)."""
+    if a == 0:
+        raise ZeroDivisionError("Division par zéro dans GF(2^8).")
+    if _MUL is None:
+        _load_tables()
+    return _INV[a]
+
+
+# --- ACCÈS AUX TABLES ---
+
+def mul_table():
+    """Table produit complète (bytes de 65536 octets, indexée par (a << 8) | b)."""
+    return _MUL or _load_tables()
+
+def mul_row(c):
+    """Ligne de multiplication par c (256 octets), pour bytes.translate."""
+    if _MUL is None:
+        _load_tables()
+    return _ROWS[c]
+
+def inv_table():
+    """Table des inverses (256 octets, l'entrée 0 vaut 0)."""
+    if _MUL is None:
+        _load_tables()
+    return _INV
+
+def log_tables():
+    """Couple (exp, log) des tables antilog (510 octets) et log (256 octets)."""
+    if _MUL is None:
+        _load_tables()
+    return _EXP, _LOG
+
+
+# --- OPÉRATIONS EN BLOC ---
+
+def gf_scale(c, vec):
+    """Produit scalaire c * vec, renvoyé sous forme de bytes."""
+    return bytes(vec).translate(mul_row(c))
+
+def gf_vec_add(a, b):
+    """Somme (XOR) de deux vecteurs de même longueur, renvoyée sous forme de bytes."""
+    n = len(a)
+    if len(b) != n:
+        raise ValueError("Les vecteurs doivent avoir la même longueur.")
+    s = int.from_bytes(bytes(a), "little") ^ int.from_bytes(bytes(b), "little")
+    return s.to_bytes(n, "little")
+
+def gf_axpy(c, x, y):
+    """Renvoie y + c * x (bytes), l'opération de base des éliminations de lignes."""
+    if c == 0:
+        return bytes(y)
+    return gf_vec_add(y, gf_scale(c, x))
+
+def gf_dot(a, b):
+    """Produit scalaire <a, b> dans GF(2^8)."""
+    mul = _MUL or _load_tables()
+    res = 0
+    for x, y in zip(a, b):
+        res ^= mul[(int(x) << 8) | int(y)]
+    return res
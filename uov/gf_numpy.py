@@ -0,0 +1,316 @@
+import numpy as np
+
+from .gf import mul_table, inv_table
+
+# --- MATRICES ET VECTEURS SUR GF(2^8) (NumPy, uint8) ---
+#
+# Toutes les multiplications passent par la table produit complète de uov/gf.py,
+# vue comme un tableau 256x256: _M[a, b] = a * b. Un produit élément par élément
+# est donc une seule lecture indexée (gather) sur des tableaux entiers, et les
+# sommes sont des XOR (bitwise_xor.reduce).
+
+_M = None
+_INV = None
+
+
+def _tables():
+    """Vues NumPy (construites une fois) de la table produit et de la table des inverses."""
+    global _M, _INV
+    if _M is None:
+        _INV = np.frombuffer(inv_table(), dtype=np.uint8)
+        _M = np.frombuffer(mul_table(), dtype=np.uint8).reshape(256, 256)
+    return _M, _INV
+
+
+_UPPER = {}
+
+def _upper_indices(n):
+    """Indices (i, j), i <= j, des monômes triangulaires supérieurs sur n variables (calculés une fois par n)."""
+    idx = _UPPER.get(n)
+    if idx is None:
+        idx = _UPPER[n] = np.triu_indices(n)
+    return idx
+
+
+_SHIFTS = np.arange(8, dtype=np.uint8)
+
+def _bitplane_product(A, planes, cols):
+    """Produit A * B sur GF(2^8), B donnée par ses plans de bits (voir GFMatrix._bit_planes).
+
+    Le produit de GF(2^8) est bilinéaire sur GF(2): pour a = sum_e a_e 2^e et
+    b = sum_c b_c 2^c, a * b = XOR_{e,c} a_e b_c (2^e * 2^c). Pour chaque couple
+    (e, c), la somme XOR sur l'indice interne est la parité d'un produit de
+    matrices 0/1, fait en une seule multiplication float32 (BLAS), exacte tant
+    que la dimension interne reste sous 2^24.
+    """
+    M, _ = _tables()
+    rows, inner = A.shape
+    bits = ((A[None] >> _SHIFTS[:, None, None]) & 1).reshape(8 * rows, inner).astype(np.float32)
+    parity = ((bits @ planes).astype(np.int32) & 1).astype(np.uint8).reshape(8, rows, 8, cols)
+    basis = M[(1 << _SHIFTS)[:, None], (1 << _SHIFTS)[None, :]]
+    terms = parity * basis[:, None, :, None]
+    return np.bitwise_xor.reduce(terms.transpose(1, 3, 0, 2).reshape(rows, cols, 64), axis=2)
+
+
+def _as_array(data):
+    """Convertit data (GFVector/GFMatrix, ndarray, bytes, listes d'entiers) en tableau uint8."""
+    if isinstance(data, (GFVector, GFMatrix)):
+        return data.data
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return np.frombuffer(data, dtype=np.uint8).copy()
+    return np.asarray(data, dtype=np.uint8)
+
+
+class GFVector:
+    """Vecteur sur GF(2^8) stocké dans un tableau uint8."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = _as_array(data)
+        if self.data.ndim != 1:
+            raise ValueError("Un GFVector doit être unidimensionnel.")
+
+    @classmethod
+    def zeros(cls, n):
+        return cls(np.zeros(n, dtype=np.uint8))
+
+    def __len__(self):
+        return self.data.shape[0]
+
+    def __iter__(self):
+        return iter(self.data.tolist())
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return GFVector(self.data[idx])
+        return int(self.data[idx])
+
+    def __eq__(self, other):
+        if not isinstance(other, GFVector):
+            other = GFVector(other)
+        return self.data.shape == other.data.shape and bool(np.array_equal(self.data, other.data))
+
+    def __repr__(self):
+        return f"GFVector({self.tolist()})"
+
+    def tolist(self):
+        return self.data.tolist()
+
+    def tobytes(self):
+        return self.data.tobytes()
+
+    def __add__(self, other):
+        """Addition (= soustraction) élément par élément: XOR."""
+        return GFVector(self.data ^ _as_array(other))
+
+    __sub__ = __add__
+    __xor__ = __add__
+
+    def scale(self, c):
+        """Produit scalaire c * self."""
+        M, _ = _tables()
+        return GFVector(M[int(c)][self.data])
+
+    def __rmul__(self, c):
+        return self.scale(c)
+
+    def dot(self, other):
+        """Produit scalaire <self, other>."""
+        M, _ = _tables()
+        return int(np.bitwise_xor.reduce(M[self.data, _as_array(other)]))
+
+    def concat(self, other):
+        """Concaténation self || other."""
+        return GFVector(np.concatenate((self.data, _as_array(other))))
+
+    def upper_products(self):
+        """Produits x_i x_j (i <= j), dans l'ordre triangulaire supérieur empaqueté (une seule lecture indexée)."""
+        M, _ = _tables()
+        I, J = _upper_indices(self.data.shape[0])
+        return GFVector(M[self.data[I], self.data[J]])
+
+    def outer(self, other):
+        """Produits self_i * other_j, rangés ligne par ligne (i d'abord)."""
+        M, _ = _tables()
+        return GFVector(M[self.data[:, None], _as_array(other)[None, :]].ravel())
+
+
+class GFMatrix:
+    """Matrice sur GF(2^8) stockée dans un tableau uint8 à deux dimensions."""
+
+    __slots__ = ("data", "_planes")
+
+    def __init__(self, data):
+        self.data = _as_array(data)
+        self._planes = None
+        if self.data.ndim != 2:
+            raise ValueError("Une GFMatrix doit être bidimensionnelle.")
+
+    @classmethod
+    def from_buffer(cls, buf, rows, cols):
+        """Matrice rows x cols lue dans buf (ligne par ligne), sans copie (vue en lecture seule)."""
+        if len(buf) != rows * cols:
+            raise ValueError("Taille de buffer incompatible avec les dimensions de la matrice.")
+        return cls(np.frombuffer(buf, dtype=np.uint8).reshape(rows, cols))
+
+    @classmethod
+    def zeros(cls, rows, cols):
+        return cls(np.zeros((rows, cols), dtype=np.uint8))
+
+    @classmethod
+    def identity(cls, n):
+        return cls(np.eye(n, dtype=np.uint8))
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Empile des lignes (GFVector ou séquences d'entiers) en une matrice."""
+        return cls(np.stack([_as_array(r) for r in rows]))
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    def __len__(self):
+        return self.data.shape[0]
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return GFMatrix(self.data[idx])
+        return GFVector(self.data[idx])
+
+    def __eq__(self, other):
+        if not isinstance(other, GFMatrix):
+            other = GFMatrix(other)
+        return self.data.shape == other.data.shape and bool(np.array_equal(self.data, other.data))
+
+    def __repr__(self):
+        return f"GFMatrix({self.tolist()})"
+
+    def tolist(self):
+        return self.data.tolist()
+
+    def tobytes(self):
+        return self.data.tobytes()
+
+    def row(self, i):
+        return GFVector(self.data[i])
+
+    def column(self, j):
+        return GFVector(np.ascontiguousarray(self.data[:, j]))
+
+    def transpose(self):
+        return GFMatrix(np.ascontiguousarray(self.data.T))
+
+    def __add__(self, other):
+        return GFMatrix(self.data ^ _as_array(other))
+
+    __sub__ = __add__
+    __xor__ = __add__
+
+    def scale(self, c):
+        """Produit scalaire c * self."""
+        M, _ = _tables()
+        return GFMatrix(M[int(c)][self.data])
+
+    def mat_vec(self, vec):
+        """Produit matrice x vecteur: self * vec."""
+        M, _ = _tables()
+        x = _as_array(vec)
+        return GFVector(np.bitwise_xor.reduce(M[self.data, x[None, :]], axis=1))
+
+    def vec_mat(self, vec, start=0):
+        """Produit vecteur ligne x matrice: vec^T * self, restreint aux colonnes start: ."""
+        M, _ = _tables()
+        x = _as_array(vec)
+        return GFVector(np.bitwise_xor.reduce(M[x[:, None], self.data[:, start:]], axis=0))
+
+    def _bit_planes(self):
+        """Plans de bits de self (lignes x 8*colonnes, float32), calculés au premier produit puis gardés."""
+        if self._planes is None:
+            rows, cols = self.data.shape
+            bits = (self.data[:, None, :] >> _SHIFTS[None, :, None]) & 1
+            self._planes = bits.reshape(rows, 8 * cols).astype(np.float32)
+        return self._planes
+
+    def mat_mat(self, other):
+        """Produit matriciel self * other.
+
+        Une accumulation vectorisée par colonne de self, ou, quand il y a
+        moins de lignes que de colonnes (xv ou monômes empilés contre une
+        clé), un produit par plans de bits: une multiplication BLAS pour tout
+        le lot. Les plans de other restent attachés à la matrice: une clé
+        réutilisée d'un lot à l'autre ne les calcule qu'une fois.
+        """
+        M, _ = _tables()
+        other = other if isinstance(other, GFMatrix) else GFMatrix(other)
+        B = other.data
+        rows, inner = self.data.shape
+        if B.shape[0] != inner:
+            raise ValueError("Dimensions incompatibles pour le produit matriciel.")
+        if rows < inner:
+            return GFMatrix(_bitplane_product(self.data, other._bit_planes(), B.shape[1]))
+        acc = np.zeros((rows, B.shape[1]), dtype=np.uint8)
+        for k in range(inner):
+            acc ^= M[self.data[:, k, None], B[None, k, :]]
+        return GFMatrix(acc)
+
+    def bilinear(self, x, y):
+        """Forme bilinéaire x^T * self * y."""
+        return self.vec_mat(x).dot(y)
+
+    def solve(self, b):
+        """Résout self * x = b par élimination de Gauss sur [self | b].
+
+        Renvoie x (GFVector), ou None dès qu'une colonne sans pivot révèle
+        que la matrice est singulière.
+        """
+        M, INV = _tables()
+        n, cols = self.data.shape
+        if n != cols:
+            raise ValueError("Le système doit être carré.")
+        aug = np.concatenate((self.data, _as_array(b)[:, None]), axis=1)
+
+        # Élimination vers l'avant: forme triangulaire supérieure à diagonale unité
+        for col in range(n):
+            nz = np.flatnonzero(aug[col:, col])
+            if nz.size == 0:
+                return None
+            pivot = col + int(nz[0])
+            if pivot != col:
+                aug[[col, pivot]] = aug[[pivot, col]]
+            aug[col, col:] = M[INV[aug[col, col]]][aug[col, col:]]
+            below = aug[col + 1:]
+            below ^= M[below[:, col, None], aug[col][None, :]]
+
+        # Remontée: seule la colonne b doit encore être mise à jour
+        for col in range(n - 1, 0, -1):
+            aug[:col, n] ^= M[aug[:col, col], aug[col, n]]
+
+        return GFVector(aug[:, n].copy())
+
+    def inverse(self):
+        """Inverse par Gauss-Jordan sur [self | I]; lève ValueError si la matrice est singulière."""
+        M, INV = _tables()
+        n, cols = self.data.shape
+        if n != cols:
+            raise ValueError("Matrice non inversible.")
+        aug = np.concatenate((self.data, np.eye(n, dtype=np.uint8)), axis=1)
+
+        for col in range(n):
+            nz = np.flatnonzero(aug[col:, col])
+            if nz.size == 0:
+                raise ValueError("Matrice non inversible.")
+            pivot = col + int(nz[0])
+            if pivot != col:
+                aug[[col, pivot]] = aug[[pivot, col]]
+
+            # Normaliser la ligne pivot
+            aug[col] = M[INV[aug[col, col]]][aug[col]]
+
+            # Éliminer la colonne dans toutes les autres lignes en une seule opération
+            factors = aug[:, col].copy()
+            factors[col] = 0
+            aug ^= M[factors[:, None], aug[col][None, :]]
+
+        return GFMatrix(aug[:, n:])
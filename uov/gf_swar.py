@@ -0,0 +1,314 @@
+from .gf import gf_inv, mul_table, mul_row
+
+# --- MATRICES ET VECTEURS SUR GF(2^8) SANS DÉPENDANCE (SWAR) ---
+#
+# Même interface que uov/gf_numpy.py, en pur Python. Un vecteur est un objet
+# bytes: l'addition de deux vecteurs est un seul XOR de grands entiers
+# (int.from_bytes), et le produit scalaire c * vec est un bytes.translate à
+# travers la ligne c de la table produit. Une matrice est un seul objet bytes,
+# lu ligne par ligne.
+
+
+def _to_int(data):
+    return int.from_bytes(data, "little")
+
+def _to_bytes(value, n):
+    return value.to_bytes(n, "little")
+
+def _as_bytes(data):
+    """Convertit data (GFVector, bytes, séquence d'entiers) en bytes."""
+    if isinstance(data, GFVector):
+        return data.data
+    if isinstance(data, bytes):
+        return data
+    return bytes(data)
+
+
+class GFVector:
+    """Vecteur sur GF(2^8) stocké dans un objet bytes."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = _as_bytes(data)
+
+    @classmethod
+    def zeros(cls, n):
+        return cls(bytes(n))
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return GFVector(self.data[idx])
+        return self.data[idx]
+
+    def __eq__(self, other):
+        return self.data == _as_bytes(other)
+
+    def __repr__(self):
+        return f"GFVector({self.tolist()})"
+
+    def tolist(self):
+        return list(self.data)
+
+    def tobytes(self):
+        return self.data
+
+    def __add__(self, other):
+        """Addition (= soustraction) élément par élément: un XOR de grands entiers."""
+        other = _as_bytes(other)
+        n = len(self.data)
+        if len(other) != n:
+            raise ValueError("Les vecteurs doivent avoir la même longueur.")
+        return GFVector(_to_bytes(_to_int(self.data) ^ _to_int(other), n))
+
+    __sub__ = __add__
+    __xor__ = __add__
+
+    def scale(self, c):
+        """Produit scalaire c * self (bytes.translate)."""
+        return GFVector(self.data.translate(mul_row(c)))
+
+    def __rmul__(self, c):
+        return self.scale(c)
+
+    def dot(self, other):
+        """Produit scalaire <self, other>."""
+        mul = mul_table()
+        res = 0
+        for x, y in zip(self.data, _as_bytes(other)):
+            res ^= mul[(x << 8) | y]
+        return res
+
+    def concat(self, other):
+        """Concaténation self || other."""
+        return GFVector(self.data + _as_bytes(other))
+
+    def upper_products(self):
+        """Produits x_i x_j (i <= j), dans l'ordre triangulaire supérieur empaqueté."""
+        x = self.data
+        return GFVector(b"".join(x[i:].translate(mul_row(c)) for i, c in enumerate(x)))
+
+    def outer(self, other):
+        """Produits self_i * other_j, rangés ligne par ligne (i d'abord)."""
+        y = _as_bytes(other)
+        return GFVector(b"".join(y.translate(mul_row(c)) for c in self.data))
+
+
+class GFMatrix:
+    """Matrice sur GF(2^8) stockée ligne par ligne dans un seul objet bytes."""
+
+    __slots__ = ("buf", "nrows", "ncols")
+
+    def __init__(self, data):
+        if isinstance(data, GFMatrix):
+            self.buf, self.nrows, self.ncols = data.buf, data.nrows, data.ncols
+            return
+        rows = [_as_bytes(r) for r in data]
+        self.nrows = len(rows)
+        self.ncols = len(rows[0]) if rows else 0
+        if any(len(r) != self.ncols for r in rows):
+            raise ValueError("Toutes les lignes d'une GFMatrix doivent avoir la même longueur.")
+        self.buf = b"".join(rows)
+
+    @classmethod
+    def from_buffer(cls, buf, rows, cols):
+        """Matrice rows x cols lue dans buf (ligne par ligne), sans copie si buf est un bytes."""
+        if len(buf) != rows * cols:
+            raise ValueError("Taille de buffer incompatible avec les dimensions de la matrice.")
+        obj = cls.__new__(cls)
+        obj.buf, obj.nrows, obj.ncols = bytes(buf), rows, cols
+        return obj
+
+    @classmethod
+    def zeros(cls, rows, cols):
+        return cls.from_buffer(bytes(rows * cols), rows, cols)
+
+    @classmethod
+    def identity(cls, n):
+        return cls([bytes(i) + b"\x01" + bytes(n - i - 1) for i in range(n)])
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Empile des lignes (GFVector ou séquences d'entiers) en une matrice."""
+        return cls(rows)
+
+    @property
+    def shape(self):
+        return (self.nrows, self.ncols)
+
+    @property
+    def rows(self):
+        c = self.ncols
+        return tuple(self.buf[i * c:(i + 1) * c] for i in range(self.nrows))
+
+    def __len__(self):
+        return self.nrows
+
+    def __getitem__(self, idx):
+        c = self.ncols
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(self.nrows)
+            if step == 1:
+                return GFMatrix.from_buffer(self.buf[start * c:max(stop, start) * c], max(stop - start, 0), c)
+            return GFMatrix(self.rows[idx])
+        if idx < 0:
+            idx += self.nrows
+        return GFVector(self.buf[idx * c:(idx + 1) * c])
+
+    def __eq__(self, other):
+        if not isinstance(other, GFMatrix):
+            other = GFMatrix(other)
+        return self.shape == other.shape and self.buf == other.buf
+
+    def __repr__(self):
+        return f"GFMatrix({self.tolist()})"
+
+    def tolist(self):
+        return [list(r) for r in self.rows]
+
+    def tobytes(self):
+        return self.buf
+
+    def row(self, i):
+        return self[i]
+
+    def column(self, j):
+        # Tranche de pas ncols: une seule copie, faite en C
+        return GFVector(self.buf[j::self.ncols])
+
+    def transpose(self):
+        # La colonne j est la tranche buf[j::ncols]
+        c = self.ncols
+        return GFMatrix.from_buffer(b"".join(self.buf[j::c] for j in range(c)), c, self.nrows)
+
+    def __add__(self, other):
+        other = GFMatrix(other)
+        if other.shape != self.shape:
+            raise ValueError("Les matrices doivent avoir les mêmes dimensions.")
+        return GFMatrix.from_buffer(_to_bytes(_to_int(self.buf) ^ _to_int(other.buf), len(self.buf)),
+                                    self.nrows, self.ncols)
+
+    __sub__ = __add__
+    __xor__ = __add__
+
+    def scale(self, c):
+        """Produit scalaire c * self."""
+        return GFMatrix.from_buffer(self.buf.translate(mul_row(c)), self.nrows, self.ncols)
+
+    def mat_vec(self, vec):
+        """Produit matrice x vecteur: combinaison des colonnes, sum_j vec_j * col_j."""
+        return self.transpose().vec_mat(vec)
+
+    def vec_mat(self, vec, start=0):
+        """Produit vecteur ligne x matrice: combinaison des lignes, sum_i vec_i * row_i.
+
+        start > 0 restreint le produit aux colonnes start: (fin de chaque ligne).
+        """
+        buf = self.buf
+        cols = self.ncols
+        start = min(start, cols)
+        acc = 0
+        off = start
+        for c in _as_bytes(vec)[:self.nrows]:
+            if c:
+                acc ^= _to_int(buf[off:off - start + cols].translate(mul_row(c)))
+            off += cols
+        return GFVector(_to_bytes(acc, cols - start))
+
+    def mat_mat(self, other):
+        """Produit matriciel self * other (chaque ligne est un vec_mat sur other)."""
+        other = GFMatrix(other)
+        if other.nrows != self.ncols:
+            raise ValueError("Dimensions incompatibles pour le produit matriciel.")
+        return GFMatrix.from_buffer(b"".join(other.vec_mat(r).data for r in self.rows),
+                                    self.nrows, other.ncols)
+
+    def bilinear(self, x, y):
+        """Forme bilinéaire x^T * self * y."""
+        return self.vec_mat(x).dot(y)
+
+    def solve(self, b):
+        """Résout self * x = b par élimination de Gauss sur [self | b].
+
+        Renvoie x (GFVector), ou None dès qu'une colonne sans pivot révèle
+        que la matrice est singulière.
+        """
+        n = self.nrows
+        if n != self.ncols:
+            raise ValueError("Le système doit être carré.")
+        b = _as_bytes(b)
+        # Ligne augmentée [A_i | b_i]: b_i occupe l'octet n
+        aug = [_to_int(r) | (c << (n << 3)) for r, c in zip(self.rows, b)]
+        if not _eliminate(aug, n, n + 1, reduce_above=False):
+            return None
+
+        # Remontée sur la forme triangulaire supérieure à diagonale unité
+        mul = mul_table()
+        x = bytearray(n)
+        for col in range(n - 1, -1, -1):
+            r = _to_bytes(aug[col], n + 1)
+            acc = r[n]
+            for j in range(col + 1, n):
+                c = r[j]
+                if c:
+                    acc ^= mul[(c << 8) | x[j]]
+            x[col] = acc
+
+        return GFVector(bytes(x))
+
+    def inverse(self):
+        """Inverse par Gauss-Jordan sur [self | I]; lève ValueError si la matrice est singulière."""
+        n = self.nrows
+        if n != self.ncols:
+            raise ValueError("Matrice non inversible.")
+        shift = n << 3
+        # Lignes augmentées [A | I] fusionnées en un seul entier par ligne
+        aug = [_to_int(r) | (1 << (shift + (i << 3))) for i, r in enumerate(self.rows)]
+        if not _eliminate(aug, n, 2 * n, reduce_above=True):
+            raise ValueError("Matrice non inversible.")
+        return GFMatrix([_to_bytes(r >> shift, n) for r in aug])
+
+
+def _eliminate(rows, n, width, reduce_above):
+    """Élimination de Gauss en place sur des lignes augmentées.
+
+    Chaque ligne est un grand entier dont l'octet k (petit-boutiste) est le
+    coefficient de la colonne k, sur width octets. Les n premières colonnes
+    sont réduites: en forme triangulaire supérieure à diagonale unité, ou en
+    identité si reduce_above est vrai (Gauss-Jordan). Une opération de ligne
+    est un seul XOR; les facteurs nuls sont sautés et, pour chaque pivot, la
+    ligne pivot multipliée par un facteur donné n'est calculée qu'une fois.
+    Renvoie False si une colonne n'a pas de pivot (matrice singulière).
+    """
+    for col in range(n):
+        shift = col << 3
+        for pivot in range(col, n):
+            if (rows[pivot] >> shift) & 0xFF:
+                break
+        else:
+            return False
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+
+        # Normaliser la ligne pivot
+        p = _to_bytes(rows[col], width)
+        p = p.translate(mul_row(gf_inv(p[col])))
+        rows[col] = _to_int(p)
+
+        scaled = {}
+        for row in range(0 if reduce_above else col + 1, n):
+            if row == col:
+                continue
+            r = rows[row]
+            factor = (r >> shift) & 0xFF
+            if factor:
+                s = scaled.get(factor)
+                if s is None:
+                    s = scaled[factor] = _to_int(p.translate(mul_row(factor)))
+                rows[row] = r ^ s
+    return True
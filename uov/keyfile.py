@@ -0,0 +1,150 @@
+import hashlib
+import mmap
+import struct
+
+from .backend import BACKEND
+from .uov import UOVKey
+
+# --- FICHIERS DE CLÉS BINAIRES ---
+#
+# Format versionné, lisible sans analyse: un en-tête fixe, une table des
+# sections, puis les sections de UOVKey telles quelles, chacune alignée sur
+# ALIGN octets. load_key projette le fichier en mémoire (mmap) et expose les
+# sections comme des memoryview: les coefficients ne sont lus qu'au premier
+# accès, et plusieurs processus qui chargent le même fichier partagent les
+# mêmes pages du cache disque.
+#
+#   en-tête   "UOVK" | version u16 | variante u8 | options u8 | n, v, m u32
+#             | nombre de sections u32 | empreinte (32 octets) | somme de contrôle (32 octets)
+#   table     par section: nom (16 octets, complété par des zéros)
+#             | position u64 | longueur u64
+#   sections  aux positions annoncées, multiples de ALIGN
+#
+# Tous les entiers sont petit-boutistes. L'empreinte identifie la clé (partie
+# publique, voir UOVKey.fingerprint); la somme de contrôle, SHA-256 de tout le
+# fichier hors ce champ, détecte une corruption de n'importe quelle section,
+# secrète comprise.
+
+MAGIC = b"UOVK"
+VERSION = 1
+ALIGN = 64
+
+VARIANTS = ("standard", "compressed", "seeded")
+FLAG_HOMOGENEOUS = 0x01
+
+_HEADER = struct.Struct("<4sHBBIIII32s32s")
+_CHECKSUM = slice(_HEADER.size - 32, _HEADER.size)
+_ENTRY = struct.Struct("<16sQQ")
+
+# Noms de section admis (ceux de UOVKey.section_shape)
+_SECTIONS = ("F_vv", "F_vo", "F_lin", "F_const", "T", "T_inv", "O", "P", "seed_sk", "seed_pk", "P3")
+
+# Sections lues comme clés de cache ou graines: toujours copiées en bytes
+_SMALL_SECTIONS = ("seed_sk", "seed_pk")
+
+
+def key_variant(key):
+    if "seed_sk" in key.sections:
+        return "seeded"
+    if "P3" in key.sections:
+        return "compressed"
+    return "standard"
+
+
+def _align(offset):
+    return -(-offset // ALIGN) * ALIGN
+
+
+def _checksum(buf):
+    """SHA-256 de tout le fichier, le champ de la somme de contrôle exclu."""
+    buf = memoryview(buf)
+    h = hashlib.sha256(buf[:_CHECKSUM.start])
+    h.update(buf[_CHECKSUM.stop:])
+    return h.digest()
+
+
+def dump_key(key):
+    """Sérialise une UOVKey au format binaire (bytes)."""
+    names = list(key.sections)
+    offset = _align(_HEADER.size + len(names) * _ENTRY.size)
+    table = []
+    for name in names:
+        table.append((name, offset, len(key.sections[name])))
+        offset = _align(offset + len(key.sections[name]))
+
+    out = bytearray(offset)
+    _HEADER.pack_into(out, 0, MAGIC, VERSION, VARIANTS.index(key_variant(key)),
+                      FLAG_HOMOGENEOUS if key.homogeneous else 0,
+                      key.n, key.v, key.m, len(names), key.fingerprint, bytes(32))
+    for i, (name, start, length) in enumerate(table):
+        _ENTRY.pack_into(out, _HEADER.size + i * _ENTRY.size, name.encode(), start, length)
+        out[start:start + length] = key.sections[name]
+    out[_CHECKSUM] = _checksum(out)
+    return bytes(out)
+
+
+def save_key(key, path):
+    """Écrit une UOVKey (clé complète ou publique) dans un fichier binaire."""
+    with open(path, "wb") as f:
+        f.write(dump_key(key))
+
+
+def parse_key(buf, check=True):
+    """Relit une clé sérialisée par dump_key dans buf (bytes, memoryview, mmap), sans copie.
+
+    check=True recalcule la somme de contrôle (tout le fichier, sections
+    secrètes comprises) et lève ValueError si elle diffère de l'en-tête.
+    """
+    buf = memoryview(buf)
+    if len(buf) < _HEADER.size:
+        raise ValueError("Fichier de clé tronqué.")
+    magic, version, variant, flags, n, v, m, count, fingerprint, checksum = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise ValueError("Ce fichier n'est pas une clé UOV.")
+    if version != VERSION:
+        raise ValueError(f"Version de fichier de clé non prise en charge : {version}.")
+    if check and _checksum(buf) != checksum:
+        raise ValueError("Somme de contrôle invalide : fichier de clé corrompu.")
+    if variant >= len(VARIANTS):
+        raise ValueError(f"Variante de clé inconnue : {variant}.")
+    if len(buf) < _HEADER.size + count * _ENTRY.size:
+        raise ValueError("Fichier de clé tronqué.")
+
+    sections = {}
+    for i in range(count):
+        raw, start, length = _ENTRY.unpack_from(buf, _HEADER.size + i * _ENTRY.size)
+        name = raw.rstrip(b"\0").decode("latin-1")
+        if name not in _SECTIONS:
+            raise ValueError(f"Section de clé inconnue : {name!r}.")
+        if name in sections:
+            raise ValueError(f"Section {name} en double.")
+        if start + length > len(buf):
+            raise ValueError(f"Section {name} hors du fichier.")
+        data = buf[start:start + length]
+        # Le moteur pur Python travaille sur des bytes: une copie au chargement
+        sections[name] = data if BACKEND == "numpy" and name not in _SMALL_SECTIONS else bytes(data)
+
+    key = UOVKey(n, v, m, sections, homogeneous=bool(flags & FLAG_HOMOGENEOUS))
+    if key_variant(key) != VARIANTS[variant]:
+        raise ValueError("Variante de clé incohérente avec ses sections.")
+    key._fingerprint = fingerprint
+    return key
+
+
+def load_key(path, check=True):
+    """Charge un fichier de clé par projection mémoire (mmap), sans copier les coefficients."""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return parse_key(mapped, check)
+
+
+def read_key_header(path):
+    """En-tête seul: dict (version, variant, homogeneous, n, v, m, fingerprint)."""
+    with open(path, "rb") as f:
+        head = f.read(_HEADER.size)
+    if len(head) < _HEADER.size or head[:4] != MAGIC:
+        raise ValueError("Ce fichier n'est pas une clé UOV.")
+    _, version, variant, flags, n, v, m, _, fingerprint, _ = _HEADER.unpack(head)
+    return {"version": version, "variant": VARIANTS[variant] if variant < len(VARIANTS) else variant,
+            "homogeneous": bool(flags & FLAG_HOMOGENEOUS), "n": n, "v": v, "m": m,
+            "fingerprint": fingerprint}
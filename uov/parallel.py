@@ -0,0 +1,100 @@
+import os
+from multiprocessing import Pool
+from multiprocessing.util import Finalize
+from multiprocessing.shared_memory import SharedMemory
+
+from .uov import SigningKey, prepare_signing_key, sign_many
+
+# --- SIGNATURE MULTI-CŒURS ---
+#
+# Toute l'arithmétique GF(2^8) est en Python: une signature occupe le GIL du
+# début à la fin, et des threads ne signent jamais en parallèle. ParallelSigner
+# répartit donc les messages sur un pool de processus. La clé développée
+# (SigningKey.tobytes) est copiée une seule fois dans un segment de mémoire
+# partagée; chaque processus s'y attache à son démarrage et relit la clé par
+# SigningKey.from_buffer, au lieu de recevoir la clé sérialisée avec chaque tâche.
+
+# État d'un processus du pool (voir _attach)
+_shm = None
+_key = None
+
+
+def _attach(name, n, v, m, structured, homogeneous):
+    """Initialisation d'un processus du pool: attache la clé partagée."""
+    global _shm, _key
+    _shm = SharedMemory(name=name)
+    size = SigningKey.buffer_size(n, v, m, structured, homogeneous)
+    _key = SigningKey.from_buffer(_shm.buf[:size], n, v, m, structured, homogeneous)
+    Finalize(None, _detach, exitpriority=10)
+
+
+def _detach():
+    # Les vues de la clé doivent disparaître avant de fermer le segment
+    global _shm, _key
+    _key = None
+    if _shm is not None:
+        _shm.close()
+        _shm = None
+
+
+def _sign_chunk(task):
+    messages, salt = task
+    return list(sign_many(_key, messages, salt=salt))
+
+
+class ParallelSigner:
+    """Signe des messages sur plusieurs processus avec une clé partagée.
+
+    À utiliser comme gestionnaire de contexte (ou appeler close()), pour
+    libérer le pool et le segment de mémoire partagée.
+    """
+
+    def __init__(self, keypair, processes=None):
+        sk = prepare_signing_key(keypair)
+        data = sk.tobytes()
+        self.processes = processes or os.cpu_count() or 1
+        self._shm = SharedMemory(create=True, size=len(data))
+        try:
+            self._shm.buf[:len(data)] = data
+            self._pool = Pool(self.processes, initializer=_attach,
+                              initargs=(self._shm.name, sk.n, sk.v, sk.m, sk.structured, sk.homogeneous))
+        except BaseException:
+            self._release_shm()
+            raise
+
+    def sign(self, message, salt=b""):
+        return self._pool.apply(_sign_chunk, (([message], bytes(salt)),))[0]
+
+    def map(self, messages, chunksize=16, salt=b""):
+        """Générateur des signatures de messages, dans l'ordre des messages (même sel pour tous, comme sign_many)."""
+        it = iter(messages)
+        salt = bytes(salt)
+
+        def chunks():
+            while True:
+                chunk = [msg for _, msg in zip(range(chunksize), it)]
+                if not chunk:
+                    return
+                yield chunk, salt
+
+        for sigs in self._pool.imap(_sign_chunk, chunks()):
+            yield from sigs
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        self._release_shm()
+
+    def _release_shm(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
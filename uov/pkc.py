@@ -0,0 +1,121 @@
+import hashlib
+
+from .backend import GFMatrix
+
+# --- CLÉS PUBLIQUES COMPRESSÉES (pkc) ---
+#
+# Variante homogène avec T = [[I_v, O], [0, I_o]] (voir KeyGen(compressed=True)).
+# Pour u = T x, la clé publique P = F o T se découpe en trois blocs:
+#   P1 (monômes vinaigre x vinaigre) = F1
+#   P2 (monômes vinaigre x huile)    = (F1 + F1^T) O + F2
+#   P3 (monômes huile x huile)       = triangulaire(O^T P1 O + O^T P2)
+# P1 et P2 sont tirés d'une graine publique par SHAKE128; seuls la graine et P3
+# sont stockés, F2 se déduit de P1, P2 et O. Tous les blocs sont en disposition
+# monôme d'abord (une ligne de m octets par monôme), comme le reste de uov.py.
+#
+# Une clé secrète peut elle-même se réduire à une graine de 32 octets: SHAKE256
+# en dérive la graine publique et O, donc F1, F2 et T.
+
+PK_SEED_BYTES = 16
+SK_SEED_BYTES = 32
+
+
+def _tri(n):
+    return n * (n + 1) // 2
+
+def _tri_row_offset(i, n):
+    """Indice du monôme (i, i) dans une forme triangulaire supérieure empaquetée sur n variables."""
+    return i * n - i * (i - 1) // 2
+
+def _xor_bytes(a, b):
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(len(a), "little")
+
+
+def expand_pk_seed(seed, n, v, m):
+    """Dérive (P1, P2) de la graine publique: P1 triangular(v) x m, P2 v x (o*m)."""
+    o = n - v
+    size_p1 = _tri(v) * m
+    size_p2 = v * o * m
+    stream = hashlib.shake_128(bytes(seed)).digest(size_p1 + size_p2)
+    P1 = GFMatrix.from_buffer(stream[:size_p1], _tri(v), m)
+    P2 = GFMatrix.from_buffer(stream[size_p1:], v, o * m)
+    return P1, P2
+
+
+def expand_sk_seed(seed, n, v):
+    """Dérive (graine publique, O) de la graine secrète: O est une matrice v x o."""
+    o = n - v
+    stream = hashlib.shake_256(bytes(seed)).digest(PK_SEED_BYTES + v * o)
+    return stream[:PK_SEED_BYTES], GFMatrix.from_buffer(stream[PK_SEED_BYTES:], v, o)
+
+
+def _symmetric_row(P1, i, v, m):
+    """Ligne i de P1 + P1^T: matrice v x m dont la ligne k est le coefficient (i, k)."""
+    buf = P1.tobytes()
+    rows = [buf[(_tri_row_offset(k, v) + i - k) * m:(_tri_row_offset(k, v) + i - k + 1) * m] for k in range(i)]
+    rows.append(bytes(m)) # diagonale: P1_ii + P1_ii = 0
+    start = (_tri_row_offset(i, v) + 1) * m
+    rows.append(buf[start:start + (v - i - 1) * m])
+    return GFMatrix.from_buffer(b"".join(rows), v, m)
+
+
+def central_vo_block(P1, P2, O):
+    """Bloc secret F2 = P2 + (P1 + P1^T) O (v x (o*m))."""
+    v, o = O.shape
+    m = P1.shape[1]
+    Ot = O.transpose()
+    P2_buf = P2.tobytes()
+    width = o * m
+    rows = []
+    for i in range(v):
+        contrib = Ot.mat_mat(_symmetric_row(P1, i, v, m)).tobytes()
+        rows.append(_xor_bytes(P2_buf[i * width:(i + 1) * width], contrib))
+    return GFMatrix.from_buffer(b"".join(rows), v, width)
+
+
+def public_oil_block(P1, P2, O):
+    """Bloc public P3 = triangulaire(O^T P1 O + O^T P2) (triangular(o) x m)."""
+    v, o = O.shape
+    m = P1.shape[1]
+    Ot = O.transpose()
+    P1_buf = P1.tobytes()
+
+    # Y = P1 O (v x (o*m)): la ligne k ne fait intervenir que les monômes (k, l), l >= k
+    rows = []
+    for k in range(v):
+        start = _tri_row_offset(k, v) * m
+        block = GFMatrix.from_buffer(P1_buf[start:start + (v - k) * m], v - k, m)
+        rows.append(O[k:].transpose().mat_mat(block).tobytes())
+    Y = GFMatrix.from_buffer(b"".join(rows), v, o * m)
+
+    # M = O^T Y + O^T P2 (o x (o*m)), puis M_ab + M_ba au-dessus de la diagonale
+    M = (Ot.mat_mat(Y) + Ot.mat_mat(P2)).tobytes()
+    width = o * m
+    packed = []
+    for a in range(o):
+        packed.append(M[a * width + a * m:a * width + (a + 1) * m])
+        for b in range(a + 1, o):
+            packed.append(_xor_bytes(M[a * width + b * m:a * width + (b + 1) * m],
+                                     M[b * width + a * m:b * width + (a + 1) * m]))
+    return GFMatrix.from_buffer(b"".join(packed), _tri(o), m)
+
+
+def assemble_public_map(P1, P2, P3):
+    """Clé publique complète (triangular(n) x m) à partir des trois blocs."""
+    v = P2.shape[0]
+    m = P1.shape[1]
+    o = P2.shape[1] // m
+    P1_buf, P2_buf, P3_buf = P1.tobytes(), P2.tobytes(), P3.tobytes()
+    parts = []
+    for i in range(v):
+        start = _tri_row_offset(i, v) * m
+        parts.append(P1_buf[start:start + (v - i) * m])
+        parts.append(P2_buf[i * o * m:(i + 1) * o * m])
+    parts.append(P3_buf)
+    return GFMatrix.from_buffer(b"".join(parts), _tri(v + o), m)
+
+
+def expand_public_key(seed, P3, n, v, m):
+    """Développe une clé publique compressée (graine, P3) en P complète."""
+    P1, P2 = expand_pk_seed(seed, n, v, m)
+    return assemble_public_map(P1, P2, P3)
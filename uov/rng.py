@@ -0,0 +1,68 @@
+import hashlib
+import os
+import threading
+
+# --- ALÉA CRYPTOGRAPHIQUE EN BLOC ---
+#
+# Tous les tirages (vinaigres, coefficients de F, T, graines) viennent d'ici.
+# Comme q = 256, un octet uniforme est un élément uniforme de GF(2^8): aucun
+# rejet, les octets sont découpés tels quels en vecteurs et matrices. Ils sont
+# tirés par blocs de BLOCK_SIZE octets, à os.urandom par défaut, ou à SHAKE256
+# en mode déterministe (seed_rng, pour les tests et les bancs d'essai).
+
+BLOCK_SIZE = 1 << 16
+
+_lock = threading.Lock()
+_buf = b""
+_pos = 0
+_seed = None     # Clé du flux SHAKE256 en mode déterministe, None pour os.urandom
+_counter = 0
+
+
+def _draw(size):
+    """Nouveau bloc de size octets (appelé sous _lock)."""
+    global _counter
+    if _seed is None:
+        return os.urandom(size)
+    block = hashlib.shake_256(_seed + _counter.to_bytes(8, "little")).digest(size)
+    _counter += 1
+    return block
+
+
+def random_bytes(n):
+    """n octets aléatoires, c'est-à-dire n éléments uniformes de GF(2^8)."""
+    global _buf, _pos
+    with _lock:
+        if _pos + n > len(_buf):
+            if n >= BLOCK_SIZE:
+                return _draw(n)
+            _buf = _buf[_pos:] + _draw(BLOCK_SIZE)
+            _pos = 0
+        out = _buf[_pos:_pos + n]
+        _pos += n
+        return out
+
+
+def seed_rng(seed=None):
+    """Passe en mode déterministe (seed: bytes, str ou int), ou revient à os.urandom si seed est None."""
+    global _buf, _pos, _seed, _counter
+    if isinstance(seed, str):
+        seed = seed.encode()
+    elif isinstance(seed, int):
+        seed = seed.to_bytes((seed.bit_length() + 8) // 8, "little", signed=True)
+    with _lock:
+        _buf, _pos, _counter = b"", 0, 0
+        _seed = None if seed is None else hashlib.shake_256(b"uov-rng" + bytes(seed)).digest(32)
+
+
+def _after_fork():
+    # Un processus fils ne doit pas rejouer les octets déjà tirés par le parent
+    global _lock, _buf, _pos, _seed, _counter
+    _lock = threading.Lock()
+    _buf, _pos, _counter = b"", 0, 0
+    if _seed is not None:
+        _seed = hashlib.shake_256(_seed + os.getpid().to_bytes(8, "little")).digest(32)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
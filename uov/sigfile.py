@@ -0,0 +1,107 @@
+import json
+import struct
+
+# --- SIGNATURES BINAIRES ET CONTENEUR .sig ---
+#
+# Une signature est encodée sur n + len(sel) octets: les n coordonnées de sigma
+# (une par octet, q = 256) suivies du sel. Le conteneur .sig ajoute un petit
+# en-tête fixe; le relire revient à découper des tranches, sans décodage JSON
+# ni validation élément par élément. Le JSON reste disponible comme export.
+#
+#   en-tête   "UOVS" | version u8 | longueur du sel u8 | n u16
+#             | empreinte de la clé publique (32 octets, zéros si inconnue)
+#   données   sigma (n octets) | sel
+#
+# Tous les entiers sont petit-boutistes. Le sel compte toujours SALT_BYTES
+# octets: un conteneur qui annonce une autre longueur est refusé.
+
+MAGIC = b"UOVS"
+VERSION = 1
+SALT_BYTES = 16
+
+_HEADER = struct.Struct("<4sBBH32s")
+
+
+def _check_salt(salt):
+    if len(salt) != SALT_BYTES:
+        raise ValueError(f"Le sel doit compter {SALT_BYTES} octets (reçu : {len(salt)}).")
+    return salt
+
+
+def encode_signature(sigma, salt=b""):
+    """sigma (n éléments de GF(256)) || sel, en bytes."""
+    return bytes(sigma) + bytes(salt)
+
+
+def decode_signature(data, n):
+    """Inverse de encode_signature: (sigma en bytes, sel)."""
+    data = bytes(data)
+    if len(data) < n:
+        raise ValueError("Signature tronquée.")
+    return data[:n], data[n:]
+
+
+def dump_signature(sigma, salt, fingerprint=None):
+    """Conteneur .sig (bytes): en-tête fixe puis encode_signature(sigma, salt)."""
+    sigma, salt = bytes(sigma), _check_salt(bytes(salt))
+    fingerprint = bytes(32) if fingerprint is None else bytes(fingerprint)
+    if len(fingerprint) != 32:
+        raise ValueError("L'empreinte de clé doit compter 32 octets.")
+    if len(sigma) > 0xFFFF:
+        raise ValueError("Signature trop longue pour le conteneur .sig.")
+    return _HEADER.pack(MAGIC, VERSION, len(salt), len(sigma), fingerprint) + sigma + salt
+
+
+def parse_signature(buf):
+    """Relit un conteneur .sig: dict (signature, salt, fingerprint); lève ValueError s'il est invalide."""
+    buf = memoryview(buf)
+    if len(buf) < _HEADER.size:
+        raise ValueError("Fichier de signature tronqué.")
+    magic, version, salt_len, n, fingerprint = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise ValueError("Ce fichier n'est pas une signature UOV binaire.")
+    if version != VERSION:
+        raise ValueError(f"Version de signature non prise en charge : {version}.")
+    if len(buf) != _HEADER.size + n + salt_len:
+        raise ValueError("Taille de signature incohérente avec l'en-tête.")
+    sigma, salt = decode_signature(buf[_HEADER.size:], n)
+    _check_salt(salt)
+    return {"signature": sigma, "salt": salt, "fingerprint": None if not any(fingerprint) else fingerprint}
+
+
+def signature_to_json(sigma, salt, **metadata):
+    """Export JSON lisible (liste d'entiers, sel en hexadécimal), avec des métadonnées libres."""
+    data = dict(metadata)
+    data["signature"] = list(bytes(sigma))
+    data["salt"] = _check_salt(bytes(salt)).hex()
+    return json.dumps(data, indent=2)
+
+
+def save_signature(path, sigma, salt, fingerprint=None):
+    with open(path, "wb") as f:
+        f.write(dump_signature(sigma, salt, fingerprint))
+
+
+def load_signature(path):
+    """Charge un .sig binaire, ou un export JSON.
+
+    Renvoie le dict de parse_signature; pour un JSON, les autres champs
+    (file_name, ...) sont conservés. Un ancien .sig JSON, sans sel, signait le
+    hash SHA-256 du fichier par l'ancienne dérivation de la cible: aucune clé
+    ne peut plus le vérifier, il est refusé (ValueError).
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw[:len(MAGIC)] == MAGIC:
+        return parse_signature(raw)
+    data = json.loads(raw)
+    sigma = data.get("signature")
+    if not isinstance(sigma, list) or not all(isinstance(x, int) and 0 <= x < 256 for x in sigma):
+        raise ValueError("La signature n'est pas au format UOV attendu (liste d'entiers de 0 à 255).")
+    if "salt" not in data:
+        raise ValueError("Ancienne signature (sans sel, antérieure à SHAKE256) : elle ne peut plus "
+                         "être vérifiée, signez à nouveau le document.")
+    data["signature"] = bytes(sigma)
+    data["salt"] = _check_salt(bytes.fromhex(data["salt"]))
+    data.setdefault("fingerprint", None)
+    return data
@@ -1,316 +1,967 @@
-import random
 import hashlib
 import json
 import sys
+import queue
+import threading
 
 # --- PARAMÈTRES & OUTILS MATHÉMATIQUES GF(2^8) ---
 
+# Corps fini q=256 et opérations par tables précalculées (voir uov/gf.py)
+from .gf import q, IRREDUCIBLE_256, gf_add, gf_sub, gf_mul, gf_inv
 
-# Corps fini: q=256 (GF(2^8))
-q = 256
-IRREDUCIBLE_256 = 0b100011101 # Polynôme: x^8 + x^4 + x^3 + x^2 + 1 
 
+# --- FONCTIONS MATHÉMATIQUES UTILITAIRES ---
 
-def gf_add(a, b):
-    """Addition dans GF(2^k) = XOR."""
-    return a ^ b
+# Algèbre linéaire vectorisée sur GF(2^8) (NumPy ou pur Python, voir uov/backend.py)
+from .backend import BACKEND, GFMatrix, GFVector
 
-def gf_sub(a, b):
-    """Soustraction dans GF(2^k) = XOR (identique à l'addition)."""
-    return a ^ b
+# Clés compressées et clés secrètes réduites à une graine (voir uov/pkc.py)
+from .pkc import (PK_SEED_BYTES, SK_SEED_BYTES, expand_pk_seed, expand_sk_seed,
+                  central_vo_block, public_oil_block, expand_public_key)
+from .cache import LRUCache
 
-def gf_mul(a, b):
-    """Multiplication dans GF(2^8) modulo x^8 + x^4 + x^3 + x^2 + 1."""
-    res = 0
-    a = int(a)
-    b = int(b)
-    
-    for _ in range(8):
-        if b & 1:
-            res ^= a
-        
-        # Réduction si le bit de poids fort (bit 7) de 'a' est un 1
-        a_high_bit = a & 0x80
-        a <<= 1
-        
-        if a_high_bit:
-            a ^= IRREDUCIBLE_256
-            
-        b >>= 1
-        
-    return res
-
-def gf_inv(a):
-    """Inverse multiplicatif de 'a' dans GF(2^8) via XGCD pour les polynômes."""
-    if a == 0:
-        raise ZeroDivisionError("Division par zéro dans GF(2^8).")
-    
-    # Algorithme d'Euclide étendu pour les polynômes
-    # r0 = IRREDUCIBLE_256, r1 = a
-    r0 = IRREDUCIBLE_256
-    r1 = a
-    x0 = 0
-    x1 = 1
-    
-    while r1 != 0:
-        # q = r0 / r1 (division polynomiale)
-        q_poly = 0
-        r_temp = r0
-        
-        # Trouver le degré de r0 et r1
-        deg_r0 = r0.bit_length() - 1
-        deg_r1 = r1.bit_length() - 1
-        
-        # Calculer le quotient q
-        while deg_r0 >= deg_r1 and deg_r1 >= 0:
-            shift = deg_r0 - deg_r1
-            q_poly |= (1 << shift)
-            r_temp ^= (r1 << shift)
-            
-            # Recalculer le degré de r_temp pour la prochaine itération
-            if r_temp == 0:
-                deg_r0 = -1
-            else:
-                deg_r0 = r_temp.bit_length() - 1
-
-        # Mise à jour des variables de l'algorithme
-        r = r_temp
-        x = x0 ^ gf_mul(q_poly, x1) # Utilisation de gf_mul
-        
-        r0, r1 = r1, r
-        x0, x1 = x1, x
-        
-        if r0 == 1:
-            # L'inverse est x0
-            return x0
-    
-    # Si on arrive ici, l'inverse n'existe pas (r0 != 1)
-    if r0 == 1:
-        return x0
-    else:
-        # Devrait être impossible si a != 0 et IRREDUCIBLE_256 est irréductible
-        raise ValueError(f"Inverse de {a} n'existe pas dans GF(2^8).")
-
-
-# --- FONCTIONS MATHÉMATIQUES UTILITAIRES ---
+# Aléa tiré par blocs (os.urandom, ou SHAKE256 en mode déterministe, voir uov/rng.py)
+from .rng import random_bytes, seed_rng
 
 def rand_vec(n):
     """Génère un vecteur aléatoire sur F_q (256)."""
-    return [random.randrange(q) for _ in range(n)]
+    return list(random_bytes(n))
+
+def rand_matrix(rows, cols):
+    """Génère une matrice aléatoire sur F_q (256)."""
+    return GFMatrix.from_buffer(random_bytes(rows * cols), rows, cols)
 
 def mat_vec_mul(M, v):
     """Multiplication Matrice x Vecteur sur F_q."""
-    res = []
-    for i in range(len(M)):
-        sum_val = 0
-        for j in range(len(v)):
-            # Utilisation de gf_add et gf_mul
-            sum_val = gf_add(sum_val, gf_mul(M[i][j], v[j]))
-        res.append(sum_val)
-    return res
+    return GFMatrix(M).mat_vec(v).tolist()
 
 def invert_matrix(M):
     """Inversion de matrice sur F_q."""
-    n = len(M)
-    A = [[int(x) for x in row] for row in M]
-    I = [[1 if i == j else 0 for j in range(n)] for i in range(n)]
-    
-    for col in range(n):
-        pivot = None
-        for row in range(col, n):
-            if A[row][col] != 0:
-                pivot = row
-                break
-        if pivot is None:
-            raise ValueError("Matrice non inversible.")
-
-        A[col], A[pivot] = A[pivot], A[col]
-        I[col], I[pivot] = I[pivot], I[col]
-
-        # Normaliser ligne
-        inv_pivot = gf_inv(A[col][col]) # Utilisation de gf_inv
-        A[col] = [gf_mul(x, inv_pivot) for x in A[col]] # Utilisation de gf_mul
-        I[col] = [gf_mul(x, inv_pivot) for x in I[col]] # Utilisation de gf_mul
-
-        # Eliminer autres lignes
-        for row in range(n):
-            if row != col:
-                factor = A[row][col]
-                # Utilisation de gf_sub et gf_mul
-                A[row] = [gf_sub(A[row][i], gf_mul(factor, A[col][i])) for i in range(n)]
-                I[row] = [gf_sub(I[row][i], gf_mul(factor, I[col][i])) for i in range(n)]
-    return I
+    return GFMatrix(M).inverse().tolist()
 
-# --- FONCTIONS UOV (GENRATION ET EVALUATION POLYNOMIALE) ---
+def solve_linear_system(A, b):
+    """Résout A x = b sur F_q par élimination de Gauss sur [A | b].
+
+    Renvoie x (GFVector), ou None si A n'est pas de rang plein.
+    """
+    return GFMatrix(A).solve(b)
+
+class BlockUnipotentMatrix:
+    """Transformation T = [[I_v, O], [0, I_o]] décrite par son seul bloc O (v x o).
+
+    Dans GF(2^8), -O = O: T est sa propre inverse, aucune inversion n'est
+    nécessaire. Appliquer T coûte v*o multiplications au lieu de n^2.
+    """
+
+    __slots__ = ("O",)
+
+    def __init__(self, O):
+        self.O = GFMatrix(O)
+
+    @property
+    def shape(self):
+        v, o = self.O.shape
+        return (v + o, v + o)
+
+    def mat_vec(self, x):
+        """T * x = (x_v + O x_o) || x_o."""
+        x = GFVector(x)
+        v = self.O.shape[0]
+        xo = x[v:]
+        return (x[:v] + self.O.mat_vec(xo)).concat(xo)
 
-# Génère les polynomes quadratiques
-def generate_uov_polynomials(n, m, v):
+    def inverse(self):
+        # T^-1 = [[I_v, -O], [0, I_o]] et -O = O en caractéristique 2
+        return self
+
+    def to_dense(self):
+        """Forme dense n x n (GFMatrix)."""
+        v, o = self.O.shape
+        rows = [[0] * i + [1] + [0] * (v - i - 1) + row for i, row in enumerate(self.O.tolist())]
+        rows += [[0] * (v + j) + [1] + [0] * (o - j - 1) for j in range(o)]
+        return GFMatrix(rows)
+
+    def tolist(self):
+        return self.to_dense().tolist()
+
+# --- FONCTIONS UOV (GENRATION ET EVALUATION POLYNOMIALE) ---
+#
+# Disposition "monôme d'abord": pour chaque monôme, les coefficients des m
+# équations sont contigus (un vecteur de m octets, une ligne de matrice).
+# Évaluer les m équations revient alors à calculer chaque produit x_i x_j une
+# seule fois et à accumuler (x_i x_j) * ligne: un seul vec_mat.
+#
+# Les formes quadratiques sont triangulaires supérieures empaquetées: les
+# monômes x_i x_j (i <= j) sont rangés ligne par ligne, (0,0) (0,1) .. (1,1) ..
+
+def triangular_size(n):
+    """Nombre de monômes x_i x_j (i <= j) sur n variables."""
+    return n * (n + 1) // 2
+
+def monomials(x):
+    """Vecteur des produits x_i x_j (i <= j), dans l'ordre triangulaire supérieur empaqueté."""
+    return GFVector(x).upper_products()
+
+# Génère les polynomes quadratiques centraux F, en disposition monôme d'abord:
+#   "vv":    triangular_size(v) x m   (x_i x_j, i <= j < v)
+#   "vo":    v x (o*m)                (ligne i: les o vecteurs de m octets des monômes x_i x_{v+j})
+#   "lin":   n x m                    (x_i)
+#   "const": vecteur de m octets
+# En mode homogène (comme la soumission UOV au NIST), F n'a que "vv" et "vo".
+def generate_uov_polynomials(n, m, v, homogeneous=False):
     o = n - v
-    polys = [] 
-    for _ in range(m):
-        poly = {
-            "vv": [[random.randrange(q) for _ in range(v)] for _ in range(v)],
-            "vo": [[random.randrange(q) for _ in range(o)] for _ in range(v)],
-            "lin": [random.randrange(q) for _ in range(n)],
-            "const": random.randrange(q),
-        }
-        polys.append(poly)
-    return polys
-
-# Évalue un polynôme F_i sur le vecteur x dans F_q.
-def eval_poly(poly, x, v):
-    o = len(x) - v
-    xv = [int(i) for i in x[:v]] # Variables Vinegar
-    xo = [int(i) for i in x[v:]]  # Variables Oil
-    res = poly["const"]
-    
-    # Terme quadratique Vinegar-Vinegar (xv_i * xv_j)
-    for i in range(v):
-        for j in range(v):
-            term = gf_mul(poly["vv"][i][j], gf_mul(xv[i], xv[j])) # Utilisation de gf_mul
-            res = gf_add(res, term) # Utilisation de gf_add
-            
-    # Terme quadratique Vinegar-Oil (xv_i * xo_j)
-    for i in range(v):
-        for j in range(o):
-            term = gf_mul(poly["vo"][i][j], gf_mul(xv[i], xo[j])) # Utilisation de gf_mul
-            res = gf_add(res, term) # Utilisation de gf_add
-            
-    # Terme linéaire
-    x_full = xv + xo 
-    for i in range(len(x_full)):
-        term = gf_mul(poly["lin"][i], x_full[i]) # Utilisation de gf_mul
-        res = gf_add(res, term) # Utilisation de gf_add
-        
-    # Le résultat est déjà réduit modulo q par les opérations gf_add/gf_mul
-    return res
+    F = {
+        "vv": rand_matrix(triangular_size(v), m),
+        "vo": rand_matrix(v, o * m),
+    }
+    if not homogeneous:
+        F["lin"] = rand_matrix(n, m)
+        F["const"] = GFVector(random_bytes(m))
+    return F
+
+# Coefficients des variables huile une fois les vinaigres xv fixés:
+# matrice o x m dont la ligne j porte le coefficient de x_{v+j} dans les m équations.
+def oil_coefficients(F, xv):
+    m = F["vv"].shape[1]
+    o = F["vo"].shape[1] // m
+    return GFMatrix.from_buffer(F["vo"].vec_mat(xv).tobytes(), o, m)
 
 #Évalue tous les polynômes F sur le vecteur x.
-def eval_polys(polys, x, v):
-    
-    return [eval_poly(p, x, v) for p in polys]
+# x n'est normalisé qu'une fois; les produits x_i x_j (VV) et x_i x_{v+j} (VO) sont calculés
+# une seule fois pour les m équations, et "vo" (v x (o*m)) est relu sans copie comme la
+# matrice (v*o) x m de ses monômes.
+def eval_polys(F, x, v):
+    x = GFVector(x)
+    xv = x[:v] # Variables Vinegar
+    xo = x[v:] # Variables Oil
+    m = F["vv"].shape[1]
+
+    y = F["vv"].vec_mat(xv.upper_products())        # Terme Vinegar-Vinegar
+    vo = GFMatrix.from_buffer(F["vo"].tobytes(), v * len(xo), m)
+    y = y + vo.vec_mat(xv.outer(xo))                # Terme Vinegar-Oil
+    if "lin" in F:
+        y = y + F["lin"].vec_mat(x) + F["const"]    # Terme linéaire et constante
+    return y.tolist()
+
+# --- CLÉ PUBLIQUE P = F o T ---
+#
+# Chaque équation publique P_k est une forme quadratique sur x^ = x || 1: les
+# termes linéaires et la constante sont les monômes x_i * 1 et 1 * 1. P est
+# stockée monôme d'abord: une matrice packed_size(n) x m. En mode homogène,
+# P est une forme quadratique sur x seul (triangular_size(n) x m).
+
+def packed_size(n, homogeneous=False):
+    """Nombre de monômes d'une équation publique à n variables (sur x || 1 sauf en mode homogène)."""
+    return triangular_size(n if homogeneous else n + 1)
+
+def compose_public_map(F, T, v):
+    """Calcule P = F o T: P_k(x) = F_k(T x), en disposition monôme d'abord."""
+    Td = T.to_dense() if isinstance(T, BlockUnipotentMatrix) else GFMatrix(T)
+    n = Td.shape[0]
+    o = n - v
+    m = F["vv"].shape[1]
+    homogeneous = "lin" not in F
+    T_top = Td[:v].transpose() # n x v: seules les v premières lignes de T rencontrent VV et VO
+
+    # Vue équation par équation des coefficients de F
+    vv = F["vv"].transpose().tobytes()
+    vo = F["vo"].tobytes()
+    if not homogeneous:
+        lin = F["lin"].transpose()
+        const = F["const"].tobytes()
+    nvv = triangular_size(v)
+
+    equations = []
+    for k in range(m):
+        # Lignes non nulles de la matrice de F_k: [0 .. 0 | VV_k triangulaire | VO_k]
+        vv_k = vv[k * nvv:(k + 1) * nvv]
+        rows = []
+        off = 0
+        for i in range(v):
+            rows.append(bytes(i) + vv_k[off:off + v - i] + vo[i * o * m + k:(i + 1) * o * m:m])
+            off += v - i
+        Q_top = GFMatrix.from_rows(rows)
+
+        # Partie quadratique M = T^T Q T, ramenée en triangulaire supérieure
+        M = T_top.mat_mat(Q_top.mat_mat(Td))
+        S = (M + M.transpose()).tobytes()
+        diag = M.tobytes()[::n + 1]
+
+        packed = bytearray()
+        if homogeneous:
+            for i in range(n):
+                packed.append(diag[i])
+                packed += S[i * n + i + 1:(i + 1) * n]
+        else:
+            # Partie linéaire l^T T, repliée dans la colonne n
+            lin_k = Td.vec_mat(lin.row(k)).tobytes()
+            for i in range(n):
+                packed.append(diag[i])
+                packed += S[i * n + i + 1:(i + 1) * n]
+                packed.append(lin_k[i])
+            packed.append(const[k])
+        equations.append(bytes(packed))
+
+    return GFMatrix.from_rows(equations).transpose()
+
+def eval_public_map(P, x, n):
+    """Évalue toutes les équations publiques P sur x (forme quadratique sur x || 1, ou sur x en mode homogène).
+
+    La variante se lit sur la clé (len(P) face à n), jamais sur la longueur de x.
+    """
+    x = GFVector(x)
+    if len(x) != n:
+        raise ValueError(f"Le vecteur doit compter n = {n} coordonnées.")
+    if len(P) != triangular_size(n):
+        x = x.concat([1])
+    return P.vec_mat(monomials(x)).tolist()
+
+# --- REPRÉSENTATION COMPACTE DES CLÉS ---
+
+def _key_digest(n, v, m, homogeneous, sections):
+    """SHA-256 des paramètres et des sections (nom, buffer) données: préimage de UOVKey.fingerprint."""
+    h = hashlib.sha256(b"UOV")
+    h.update(bytes([homogeneous]))
+    for dim in (n, v, m):
+        h.update(dim.to_bytes(4, "little"))
+    for name, buf in sections:
+        h.update(name.encode() + len(buf).to_bytes(8, "little"))
+        h.update(buf)
+    return h.digest()
+
+class UOVKey:
+    """Clé UOV compacte: chaque section de coefficients est un buffer bytes contigu.
+
+    key["P"], key["F"], key["T"], key["T_inv"] renvoient des vues GFMatrix /
+    GFVector construites à la demande sur ces buffers (sans copie avec les deux
+    moteurs), de sorte que Sign et Verify s'utilisent comme avec un dict.
+    Sections: "F_vv", "F_vo", "F_lin", "F_const" (absentes en mode homogène),
+    "T", "T_inv" ou "O" (T en bloc unipotent), et la partie publique: "P",
+    ou "seed_pk" + "P3" pour une clé compressée. Une clé publique ne contient
+    que sa partie publique; une clé compressée développe P au premier accès
+    à key["P"] et la garde en cache. Une clé secrète peut se réduire à
+    "seed_sk": F et T sont alors développés à la demande; Sign garde la
+    forme développée dans le cache de signature partagé (voir
+    prepare_signing_key et set_signing_cache_size).
+    """
+
+    __slots__ = ("n", "v", "m", "homogeneous", "sections", "_expanded_P", "_P", "_equations", "_fingerprint")
+
+    PUBLIC_SECTIONS = ("P", "seed_pk", "P3")
+
+    def __init__(self, n, v, m, sections, homogeneous=False):
+        self.n, self.v, self.m = n, v, m
+        self.homogeneous = homogeneous
+        self._expanded_P = None
+        self._P = None
+        self._equations = {}
+        self._fingerprint = None
+        self.sections = {}
+        for name, buf in sections.items():
+            rows, cols = self.section_shape(name)
+            if len(buf) != rows * cols:
+                raise ValueError(f"Section {name} : {len(buf)} octets, {rows * cols} attendus.")
+            # Une memoryview (fichier projeté en mémoire, voir uov/keyfile.py) est gardée sans copie
+            self.sections[name] = buf if isinstance(buf, memoryview) else bytes(buf)
+
+    @classmethod
+    def from_components(cls, n, v, m, F=None, T=None, T_inv=None, P=None, homogeneous=False,
+                        seed_pk=None, P3=None, seed_sk=None):
+        """Construit la clé à partir des objets produits par KeyGen."""
+        sections = {}
+        if seed_sk is not None:
+            sections["seed_sk"] = bytes(seed_sk)
+        if F is not None:
+            sections["F_vv"] = F["vv"].tobytes()
+            sections["F_vo"] = F["vo"].tobytes()
+            if not homogeneous:
+                sections["F_lin"] = F["lin"].tobytes()
+                sections["F_const"] = F["const"].tobytes()
+        if isinstance(T, BlockUnipotentMatrix):
+            sections["O"] = T.O.tobytes()
+        elif T is not None:
+            sections["T"] = GFMatrix(T).tobytes()
+            if T_inv is not None:
+                sections["T_inv"] = GFMatrix(T_inv).tobytes()
+        if P is not None:
+            sections["P"] = P.tobytes()
+        if seed_pk is not None:
+            sections["seed_pk"] = bytes(seed_pk)
+            sections["P3"] = P3.tobytes()
+        return cls(n, v, m, sections, homogeneous=homogeneous)
+
+    @classmethod
+    def from_seed(cls, seed_sk, n, v, m):
+        """Clé de signature réduite à sa graine secrète.
+
+        La graine détermine seed_pk et O: la partie publique compressée
+        (seed_pk + P3) en est dérivée ici, public_key() est donc complète.
+        """
+        seed_pk, O = expand_sk_seed(seed_sk, n, v)
+        P1, P2 = expand_pk_seed(seed_pk, n, v, m)
+        P3 = public_oil_block(P1, P2, O)
+        return cls.from_components(n, v, m, homogeneous=True, seed_pk=seed_pk, P3=P3, seed_sk=seed_sk)
+
+    def section_shape(self, name):
+        """Dimensions (lignes, colonnes) d'une section."""
+        n, v, m = self.n, self.v, self.m
+        o = n - v
+        shapes = {
+            "F_vv": (triangular_size(v), m),
+            "F_vo": (v, o * m),
+            "F_lin": (n, m),
+            "F_const": (1, m),
+            "T": (n, n),
+            "T_inv": (n, n),
+            "O": (v, o),
+            "P": (packed_size(n, self.homogeneous), m),
+            "seed_sk": (1, SK_SEED_BYTES),
+            "seed_pk": (1, PK_SEED_BYTES),
+            "P3": (triangular_size(o), m),
+        }
+        if name not in shapes:
+            raise KeyError(f"Section de clé inconnue : {name}")
+        return shapes[name]
+
+    def _view(self, name):
+        rows, cols = self.section_shape(name)
+        return GFMatrix.from_buffer(self.sections[name], rows, cols)
+
+    def __getitem__(self, name):
+        if name in ("n", "v", "m"):
+            return getattr(self, name)
+        if name in ("F", "T", "T_inv") and "seed_sk" in self.sections:
+            return self.expanded_secret_key()[name]
+        if name == "F" and "F_vv" in self.sections:
+            F = {"vv": self._view("F_vv"), "vo": self._view("F_vo")}
+            if not self.homogeneous:
+                F["lin"] = self._view("F_lin")
+                F["const"] = GFVector(self.sections["F_const"])
+            return F
+        if name in ("T", "T_inv") and "O" in self.sections:
+            return BlockUnipotentMatrix(self._view("O"))
+        if name == "P" and ("P" in self.sections or "P3" in self.sections):
+            # Même vue d'un accès à l'autre: les plans de bits de verify_many y restent attachés
+            if self._P is None:
+                self._P = self._view("P") if "P" in self.sections else self.expanded_public_map()
+            return self._P
+        if name in self.sections:
+            return self._view(name)
+        raise KeyError(name)
+
+    def __contains__(self, name):
+        # Répond sur les noms seuls: "F" in key ne développe pas une clé réduite à sa graine
+        return name in self.keys() or name in self.sections
+
+    def keys(self):
+        names = ["n", "v", "m"]
+        if "F_vv" in self.sections or "seed_sk" in self.sections:
+            names.append("F")
+        if "O" in self.sections or "T" in self.sections or "seed_sk" in self.sections:
+            names += ["T", "T_inv"]
+        if "P" in self.sections or "P3" in self.sections:
+            names.append("P")
+        return names
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    @property
+    def compressed(self):
+        return "P3" in self.sections
+
+    def expanded_public_map(self):
+        """P complète d'une clé compressée, développée une fois puis gardée en cache."""
+        if self._expanded_P is None:
+            P = expand_public_key(self.sections["seed_pk"], self._view("P3"), self.n, self.v, self.m)
+            self._expanded_P = P.tobytes()
+        rows, cols = self.section_shape("P")
+        return GFMatrix.from_buffer(self._expanded_P, rows, cols)
+
+    @property
+    def fingerprint(self):
+        """Empreinte SHA-256 (32 octets) des paramètres et de la partie publique.
+
+        Une clé et sa clé publique ont la même empreinte; une clé sans partie
+        publique (graine secrète seule) est identifiée par toutes ses sections.
+        """
+        if self._fingerprint is None:
+            names = [k for k in self.PUBLIC_SECTIONS if k in self.sections] or sorted(self.sections)
+            self._fingerprint = _key_digest(self.n, self.v, self.m, self.homogeneous,
+                                            [(name, self.sections[name]) for name in names])
+        return self._fingerprint
+
+    def equation(self, k):
+        """Coefficients de l'équation publique k (un octet par monôme), extraits au premier usage."""
+        eq = self._equations.get(k)
+        if eq is None:
+            eq = self._equations[k] = self["P"].column(k)
+        return eq
+
+    def expanded_secret_key(self):
+        """F et T développés depuis "seed_sk" (sans cache: Sign passe par prepare_signing_key)."""
+        return expand_secret_seed(self.sections["seed_sk"], self.n, self.v, self.m)
+
+    def public_key(self):
+        """Clé publique seule ("P", ou "seed_pk" + "P3" si la clé est compressée)."""
+        sections = {k: buf for k, buf in self.sections.items() if k in self.PUBLIC_SECTIONS}
+        pk = UOVKey(self.n, self.v, self.m, sections, homogeneous=self.homogeneous)
+        pk._expanded_P, pk._P = self._expanded_P, self._P
+        return pk
+
+    @property
+    def nbytes(self):
+        """Taille totale des coefficients stockés, en octets."""
+        return sum(len(buf) for buf in self.sections.values())
+
+    def __repr__(self):
+        return f"UOVKey(n={self.n}, v={self.v}, m={self.m}, homogeneous={self.homogeneous}, sections={sorted(self.sections)}, nbytes={self.nbytes})"
+
+# --- CLÉ DE SIGNATURE DÉVELOPPÉE ---
+#
+# Sign ne lit F que sous une forme préparée une fois pour toutes: avec
+# xh = xv || 1, les termes linéaires et la constante se replient dans les
+# blocs vinaigre, et chaque tentative se réduit à deux vec_mat contigus:
+#   b = t - VV'(monômes de xh)           VV': triangular_size(v+1) x m
+#   A = sum_i xh_i * VO'_i               VO': (v+1) x (m*o), VO'_i = matrice m x o
+# VV' est déjà triangulaire supérieure (symétrisée) et chaque VO'_i est rangée
+# équation par équation, de sorte que la somme donne directement A ligne par ligne.
+# En mode homogène il n'y a ni termes linéaires ni constante: xh = xv, VV' = VV
+# (triangular_size(v) x m) et VO' n'a que v lignes.
+
+class SigningKey:
+    """Clé de signature développée (voir prepare_signing_key)."""
+
+    __slots__ = ("n", "v", "m", "vv", "vo", "T_inv")
+
+    def __init__(self, n, v, m, vv, vo, T_inv):
+        self.n, self.v, self.m = n, v, m
+        self.vv, self.vo, self.T_inv = vv, vo, T_inv
+
+    @classmethod
+    def from_key(cls, keypair):
+        F = keypair["F"]
+        n, v, m = keypair["n"], keypair["v"], keypair["m"]
+        o = n - v
+        vo = F["vo"].tobytes()
+        blocks = [vo[i * o * m:(i + 1) * o * m] for i in range(v)]
+        if "lin" in F:
+            vv = F["vv"].tobytes()
+            lin = F["lin"].tobytes()
+
+            # VV': ligne i = monômes (i, i..v-1) puis x_i * 1 (Lin V); dernière ligne: constante
+            rows = []
+            off = 0
+            for i in range(v):
+                rows.append(vv[off:off + (v - i) * m])
+                rows.append(lin[i * m:(i + 1) * m])
+                off += (v - i) * m
+            rows.append(F["const"].tobytes())
+            vv_ext = GFMatrix.from_buffer(b"".join(rows), triangular_size(v + 1), m)
+            blocks.append(lin[v * m:]) # Dernière ligne de VO': Lin O
+        else:
+            vv_ext = F["vv"]
+
+        # VO': chaque bloc o x m (huile d'abord) transposé en m x o
+        vo_ext = GFMatrix.from_buffer(b"".join(bytes(blk[k::m]) for blk in blocks for k in range(m)),
+                                      len(blocks), m * o)
+
+        T_inv = keypair["T_inv"]
+        if not isinstance(T_inv, BlockUnipotentMatrix):
+            T_inv = GFMatrix(T_inv)
+        return cls(n, v, m, vv_ext, vo_ext, T_inv)
+
+    @property
+    def structured(self):
+        return isinstance(self.T_inv, BlockUnipotentMatrix)
+
+    @property
+    def homogeneous(self):
+        return self.vo.shape[0] == self.v
+
+    def extend(self, xv):
+        """xh: xv || 1, ou xv seul en mode homogène."""
+        return xv if self.homogeneous else xv.concat([1])
+
+    @staticmethod
+    def buffer_size(n, v, m, structured, homogeneous=False):
+        o = n - v
+        w = v if homogeneous else v + 1
+        return triangular_size(w) * m + w * m * o + (v * o if structured else n * n)
+
+    def tobytes(self):
+        """VV' || VO' || T_inv (bloc O si T est structurée, sinon forme dense n x n)."""
+        T_part = self.T_inv.O if self.structured else self.T_inv
+        return self.vv.tobytes() + self.vo.tobytes() + T_part.tobytes()
+
+    @classmethod
+    def from_buffer(cls, buf, n, v, m, structured, homogeneous=False):
+        """Relit tobytes() sans copie (vues sur buf, par exemple une mémoire partagée)."""
+        o = n - v
+        w = v if homogeneous else v + 1
+        buf = memoryview(buf)
+        if len(buf) != cls.buffer_size(n, v, m, structured, homogeneous):
+            raise ValueError("Taille de buffer incompatible avec la clé de signature.")
+        vv_end = triangular_size(w) * m
+        vo_end = vv_end + w * m * o
+        vv = GFMatrix.from_buffer(buf[:vv_end], triangular_size(w), m)
+        vo = GFMatrix.from_buffer(buf[vv_end:vo_end], w, m * o)
+        if structured:
+            T_inv = BlockUnipotentMatrix(GFMatrix.from_buffer(buf[vo_end:], v, o))
+        else:
+            T_inv = GFMatrix.from_buffer(buf[vo_end:], n, n)
+        return cls(n, v, m, vv, vo, T_inv)
+
+    @property
+    def nbytes(self):
+        return len(self.vv.tobytes()) + len(self.vo.tobytes())
+
+def prepare_signing_key(keypair):
+    """Développe (une fois) la clé secrète sous la forme utilisée par Sign.
+
+    Les clés réduites à une graine sont gardées dans le cache de signature partagé.
+    """
+    if isinstance(keypair, SigningKey):
+        return keypair
+    if isinstance(keypair, UOVKey) and "seed_sk" in keypair.sections:
+        cache_key = (keypair.n, keypair.v, keypair.m, keypair.sections["seed_sk"])
+        sk = _signing_cache.get(cache_key)
+        if sk is None:
+            sk = SigningKey.from_key(keypair.expanded_secret_key())
+            _signing_cache.put(cache_key, sk)
+        return sk
+    return SigningKey.from_key(keypair)
+
+# --- CLÉS SECRÈTES RÉDUITES À UNE GRAINE ---
+#
+# Les clés de signature développées sont gardées dans un cache LRU borné,
+# partagé par tout le processus: seules les clés qui signent activement occupent
+# de la mémoire, les autres restent sous forme de graines de 32 octets.
+
+SIGNING_CACHE_SIZE = 64
+
+_signing_cache = LRUCache(SIGNING_CACHE_SIZE)
+
+def set_signing_cache_size(maxsize):
+    """Fixe le nombre maximal de clés secrètes développées gardées en mémoire."""
+    _signing_cache.resize(maxsize)
+
+def clear_signing_cache():
+    _signing_cache.clear()
+
+def signing_cache_info():
+    """Statistiques du cache de signature (hits, misses, size, maxsize)."""
+    return _signing_cache.info()
+
+def expand_secret_seed(seed_sk, n, v, m):
+    """Développe une graine secrète en clé de signature complète (F, O)."""
+    seed_pk, O = expand_sk_seed(seed_sk, n, v)
+    P1, P2 = expand_pk_seed(seed_pk, n, v, m)
+    F = {"vv": P1, "vo": central_vo_block(P1, P2, O)}
+    return UOVKey.from_components(n, v, m, F=F, T=BlockUnipotentMatrix(O), homogeneous=True)
 
 # --- FONCTIONS PRINCIPALES ---
 
 #Génère les clés secrètes et publiques UOV.
-def KeyGen(n, v, m):
+# structured_T=True: T en bloc unipotent [[I_v, O], [0, I_o]] (inverse immédiate, application en v*o).
+# homogeneous=True: F et P purement quadratiques, sans termes linéaires ni constante.
+# compressed=True: clé publique compressée (graine + P3), implique les deux options précédentes.
+# seeded=True: en plus, clé secrète réduite à une graine de 32 octets (F et T développés à la signature).
+def KeyGen(n, v, m, structured_T=False, homogeneous=False, compressed=False, seeded=False):
     if n - v != m:
         raise ValueError("Erreur de dimension: n - v doit être égal à m (taille de l'huile o).")
         
     print(f"Génération de clés sur GF(2^{n.bit_length()-1}) avec q={q}...")
+
+    if seeded:
+        # Graine publique et O dérivées de la graine secrète
+        key = UOVKey.from_seed(random_bytes(SK_SEED_BYTES), n, v, m)
+        print("Clé secrète (graine) et clé publique compressée générées.")
+        return key
+
+    if compressed:
+        # P1, P2 tirés de la graine publique; F1 = P1 et F2 s'en déduisent avec O
+        seed_pk = random_bytes(PK_SEED_BYTES)
+        T = BlockUnipotentMatrix(rand_matrix(v, n - v))
+        P1, P2 = expand_pk_seed(seed_pk, n, v, m)
+        F = {"vv": P1, "vo": central_vo_block(P1, P2, T.O)}
+        P3 = public_oil_block(P1, P2, T.O)
+        print("Clé publique compressée (graine + P3) générée.")
+        return UOVKey.from_components(n, v, m, F=F, T=T, homogeneous=True, seed_pk=seed_pk, P3=P3)
     
     # F (Polynômes centraux secrets)
-    F = generate_uov_polynomials(n, m, v)
+    F = generate_uov_polynomials(n, m, v, homogeneous)
 
     # T (Transformation affine secrète)
-    while True:
-        T = [[random.randrange(q) for _ in range(n)] for _ in range(n)]
-        try:
-            T_inv = invert_matrix(T)
-            print("Matrice de transformation T inversible trouvée.")
-            break
-        except Exception:
-            continue
-
-    return {
-        "n": n, "v": v, "m": m,
-        "F": F,
-        "T": T,
-        "T_inv": T_inv
-    }
+    if structured_T:
+        T = BlockUnipotentMatrix(rand_matrix(v, n - v))
+        T_inv = T.inverse()
+        print("Transformation T structurée (bloc unipotent) générée.")
+    else:
+        while True:
+            T = rand_matrix(n, n)
+            try:
+                T_inv = T.inverse()
+                print("Matrice de transformation T inversible trouvée.")
+                break
+            except ValueError:
+                continue
+
+    # P = F o T (Clé publique)
+    P = compose_public_map(F, T, v)
+
+    return UOVKey.from_components(n, v, m, F=F, T=T, T_inv=T_inv, P=P, homogeneous=homogeneous)
+
+# --- HACHAGE VERS LE CORPS ---
+#
+# Le vecteur cible est t = XOF(longueur du sel || sel || message), SHAKE256 par
+# défaut, tiré directement sur m octets (q = 256: un octet par coordonnée). Le
+# message est absorbé au fil de la lecture. sign_digest et verify_digest prennent t déjà calculé, par exemple par
+# un service qui a haché le contenu en amont.
+
+# Taille des blocs lus dans les fichiers à signer ou vérifier
+READ_CHUNK = 1 << 20
+
+def _update_hash(h, chunk):
+    h.update(chunk.encode() if isinstance(chunk, str) else chunk)
+
+# Absorbe le message dans h au fil de la lecture.
+# message: str (encodé en UTF-8), bytes, bytearray, memoryview, fichier binaire
+# (objet avec read) ou itérable de morceaux (bytes ou str): rien n'est copié en entier.
+def _absorb(h, message):
+    if isinstance(message, (str, bytes, bytearray, memoryview)):
+        _update_hash(h, message)
+    elif hasattr(message, "read"):
+        for chunk in iter(lambda: message.read(READ_CHUNK), message.read(0)):
+            _update_hash(h, chunk)
+    else:
+        for chunk in message:
+            _update_hash(h, chunk)
+
+def hash_to_target(message, salt, params, xof=hashlib.shake_256):
+    """Vecteur cible t = XOF(len(salt) || salt || message) sur m octets.
+
+    La longueur du sel (4 octets) et le sel précèdent le message: la frontière
+    entre les deux est sans ambiguïté (une signature sur (M, S) ne vaut pas
+    pour (M || S[:k], S[k:])). params: m lui-même, ou une clé dont on lit "m".
+    xof: constructeur d'une fonction à sortie extensible (update, digest(longueur)),
+    SHAKE256 par défaut, qui est aussi celui de Sign et Verify; une cible tirée d'un
+    autre XOF (hashlib.shake_128, ...) passe par sign_digest / verify_digest.
+    """
+    m = params if isinstance(params, int) else params["m"]
+    salt = bytes(salt)
+    h = xof(len(salt).to_bytes(4, "little") + salt)
+    _absorb(h, message)
+    return GFVector(h.digest(m))
+
+def _as_target(target, m):
+    target = GFVector(target)
+    if len(target) != m:
+        raise ValueError(f"Le vecteur cible doit compter m = {m} octets.")
+    return target
+
+# Partie d'une tentative qui ne dépend que des vinaigres xv:
+# F(xv, 0) (termes VV, Lin V et constante) et A (m x o, termes VO et Lin O).
+def _vinegar_terms(sk, xv):
+    xh = sk.extend(xv)
+    known = sk.vv.vec_mat(monomials(xh))
+    A = GFMatrix.from_buffer(sk.vo.vec_mat(xh).tobytes(), sk.m, sk.n - sk.v)
+    return known, A
+
+# Fin d'une tentative: résout A xo = b et renvoie sigma = T_inv(xv || xo), ou None si A est singulière.
+def _complete_signature(sk, xv, b, A):
+    xo = solve_linear_system(A, b)
+    if xo is None:
+        return None
+    return sk.T_inv.mat_vec(xv.concat(xo)).tolist()
 
 #Algorithme de signature UOV.
-def Sign(keypair, message):
-    F = keypair["F"]
-    T_inv = keypair["T_inv"]
-    n = keypair["n"]
-    v = keypair["v"]
-    m = keypair["m"]
-    o = n - v
-    
-    # Hashage
-    h = hashlib.sha256(message.encode()).digest()
-    while len(h) < m: 
-        h += hashlib.sha256(h).digest()
-    t = [h[i] % q for i in range(m)] # Target vector
+# keypair: clé secrète (UOVKey, dict) ou clé déjà développée par prepare_signing_key.
+# message: texte, octets, fichier binaire ou itérable de morceaux (voir hash_to_target).
+def Sign(keypair, message, salt=b""):
+    sk = prepare_signing_key(keypair)
+    return sign_digest(sk, hash_to_target(message, salt, sk.m))
+
+#Signature d'un vecteur cible déjà calculé (voir hash_to_target).
+def sign_digest(keypair, target):
+    sk = prepare_signing_key(keypair)
+    v = sk.v
+    t = _as_target(target, sk.m) # Target vector
 
     max_tries = 1000
     for attempt in range(max_tries):
         # 1. Tirer les vinegar aléatoirement
-        xv = rand_vec(v)
-
-        # 2. Construire système linéaire Ax = b pour les huiles (xo)
-        A = [[0]*o for _ in range(m)]
-        b = [0]*m
-
-        for p_idx, poly in enumerate(F):
-            # Calculer la valeur connue C = F_i(xv, 0) - F_i(0, 0)
-            val_known = poly["const"]
-            
-            # Terme VV
-            vv_sum = 0
-            for i in range(v):
-                for j in range(v):
-                    term = gf_mul(poly["vv"][i][j], gf_mul(xv[i], xv[j]))
-                    vv_sum = gf_add(vv_sum, term)
-            val_known = gf_add(val_known, vv_sum)
-            
-            # Terme Lin V
-            lin_v_sum = 0
-            for i in range(v):
-                term = gf_mul(poly["lin"][i], xv[i])
-                lin_v_sum = gf_add(lin_v_sum, term)
-            val_known = gf_add(val_known, lin_v_sum)
-            
-            # b = target - known
-            b[p_idx] = gf_sub(t[p_idx], val_known) # Utilisation de gf_sub
-
-            # Matrice A (Coefficients des variables huile)
-            for j in range(o):
-                coeff = 0
-                # Terme quadratique (vo)
-                for i in range(v):
-                    term = gf_mul(poly["vo"][i][j], xv[i])
-                    coeff = gf_add(coeff, term)
-                # Terme linéaire (lin)
-                coeff = gf_add(coeff, poly["lin"][v + j])
-                A[p_idx][j] = coeff
-
-        # 3. Résolution
-        try:
-            A_inv = invert_matrix(A)
-            xo = mat_vec_mul(A_inv, b)
-            
-            # 4. Reconstitution u = xv || xo
-            u = xv + xo
-            
-            # 5. Signature sigma = T_inv(u)
-            sigma = mat_vec_mul(T_inv, u)
-            return sigma
+        xv = GFVector(random_bytes(v))
+
+        # 2. Construire système linéaire Ax = b pour les huiles (xo), b = target - F(xv, 0)
+        known, A = _vinegar_terms(sk, xv)
+        b = t - known
 
-        except ValueError:
-            # Matrice singulière, on recommence
-            continue
+        # 3-5. Résolution, u = xv || xo et sigma = T_inv(u)
+        sigma = _complete_signature(sk, xv, b, A)
+        if sigma is not None:
+            return sigma
+        # Matrice singulière, on recommence
 
     raise Exception("Échec de signature : impossible de trouver une matrice inversible après 1000 essais.")
 
-#Algorithme de vérification UOV.
-def Verify(keypair, message, sigma):
-    
-    F = keypair["F"]
-    T = keypair["T"]
-    v = keypair["v"]
-    m = keypair["m"]
-    
+#Signe une suite de messages avec la même clé (générateur, une signature par message, dans l'ordre).
+# La clé n'est préparée qu'une fois, et les évaluations vinaigre de batch_size messages
+# sont faites ensemble: les xv empilés en matrice, VV et VO deviennent deux produits matriciels.
+# Avec NumPy, chacun est un seul produit par plans de bits (voir GFMatrix.mat_mat); le moteur
+# pur Python les évalue ligne par ligne, le lot ne partage alors que la préparation de la clé.
+def sign_many(keypair, messages, batch_size=16, salt=b""):
+    sk = prepare_signing_key(keypair)
+    v = sk.v
+    m = sk.m
+    o = sk.n - v
+
+    it = iter(messages)
+    while True:
+        batch = [msg for _, msg in zip(range(batch_size), it)]
+        if not batch:
+            return
+
+        # Un vecteur vinaigre par message, xh = xv || 1 (xv en mode homogène) en lignes
+        X = rand_matrix(len(batch), v)
+        XH = GFMatrix.from_rows([sk.extend(X[k]) for k in range(len(batch))])
+        known = GFMatrix.from_rows([monomials(XH[k]) for k in range(len(batch))]).mat_mat(sk.vv)
+        oil = XH.mat_mat(sk.vo)
+
+        for k, msg in enumerate(batch):
+            t = hash_to_target(msg, salt, m)
+            A = GFMatrix.from_buffer(oil[k].tobytes(), m, o)
+            sigma = _complete_signature(sk, X[k], t - known[k], A)
+            if sigma is None:
+                # Matrice singulière (rare): nouveaux vinaigres pour ce seul message
+                sigma = sign_digest(sk, t)
+            yield sigma
+
+#Algorithme de vérification UOV (n'utilise que la clé publique P).
+# message: mêmes formes que pour Sign.
+# early_abort=True: équations évaluées une par une, arrêt à la première qui diffère.
+def Verify(keypair, message, sigma, salt=b"", early_abort=False):
     # 1. Hashing
-    h = hashlib.sha256(message.encode()).digest()
-    while len(h) < m: 
-        h += hashlib.sha256(h).digest()
-    target = [h[i] % q for i in range(m)]
+    return verify_digest(keypair, hash_to_target(message, salt, keypair["m"]), sigma, early_abort)
+
+#Vérification pour un vecteur cible déjà calculé (voir hash_to_target).
+def verify_digest(keypair, target, sigma, early_abort=False):
+    target = _as_target(target, keypair["m"]).tolist()
+    if early_abort:
+        return _verify_early_abort(keypair, target, sigma)
+
+    P = keypair["P"]
+    
+    sigma = GFVector(sigma)
+    if len(sigma) != keypair["n"]:
+        return False
     
     # 2. Calculer P(sigma) = F( T(sigma) )
-    u = mat_vec_mul(T, sigma)
-    y = eval_polys(F, u, v)
+    y = eval_public_map(P, sigma, keypair["n"])
     
     # 3. Comparaison
     return y == target
+
+# Équation publique k seule (coefficients d'une colonne de P).
+# Une UOVKey ne l'extrait qu'au premier besoin et la garde: les équations jamais atteintes
+# par une vérification anticipée ne sont jamais matérialisées.
+def _public_equation(keypair, k):
+    if isinstance(keypair, UOVKey):
+        return keypair.equation(k)
+    return keypair["P"].column(k)
+
+# Vérification anticipée: pour une signature fausse, la première équation diffère déjà
+# avec probabilité 255/256, et le rejet ne coûte alors qu'un produit scalaire. Les
+# EARLY_ABORT_PROBES premières équations sont évaluées une à une; si elles concordent
+# (signature très probablement valide), les autres sont évaluées en un seul bloc, sur les
+# seules colonnes EARLY_ABORT_PROBES: de P.
+# Limite: P est rangée monôme par monôme, extraire une équation parcourt donc toute la
+# matrice (et une clé compressée développe d'abord P). Une UOVKey garde les équations
+# extraites: ce coût n'est payé qu'à la première vérification.
+EARLY_ABORT_PROBES = 2
+
+def _verify_early_abort(keypair, target, sigma):
+    x = GFVector(sigma)
+    n = keypair["n"]
+    if len(x) != n:
+        return False
+    mon = None
+    probes = min(EARLY_ABORT_PROBES, len(target))
+    for k in range(probes):
+        eq = _public_equation(keypair, k)
+        if mon is None:
+            # Monômes de x || 1, ou de x seul pour une clé homogène (lue sur la clé)
+            mon = monomials(x if len(eq) == triangular_size(n) else x.concat([1]))
+        if mon.dot(eq) != target[k]:
+            return False
+    return keypair["P"].vec_mat(mon, probes).tolist() == target[probes:]
+
+#Vérifie une suite de couples (message, sigma) sous la même clé publique.
+# Renvoie la liste des résultats (booléens), dans l'ordre. P n'est lue qu'une fois et, par
+# lots de batch_size, les monômes des sigma sont empilés: un seul produit matriciel évalue
+# toutes les équations de tout le lot. Avec NumPy, ce produit passe par les plans de bits de P
+# (une multiplication BLAS par lot, plans calculés une fois par clé); le moteur pur Python
+# l'évalue signature par signature. Une signature mal formée est simplement invalide.
+def verify_many(keypair, pairs, batch_size=64, salt=b""):
+    P = keypair["P"]
+    n = keypair["n"]
+    m = keypair["m"]
+    homogeneous = len(P) == triangular_size(n)
+
+    results = []
+    it = iter(pairs)
+    while True:
+        batch = [pair for _, pair in zip(range(batch_size), it)]
+        if not batch:
+            return results
+
+        rows, targets, valid = [], [], []
+        for message, sigma in batch:
+            try:
+                x = GFVector(sigma)
+            except (TypeError, ValueError, OverflowError):
+                x = None
+            if x is None or len(x) != n:
+                valid.append(False)
+                continue
+            valid.append(True)
+            rows.append(monomials(x if homogeneous else x.concat([1])))
+            targets.append(hash_to_target(message, salt, m))
+
+        Y = GFMatrix.from_rows(rows).mat_mat(P) if rows else None
+        k = 0
+        for ok in valid:
+            if ok:
+                ok = Y[k] == targets[k]
+                k += 1
+            results.append(ok)
+
+# --- CACHE DES VÉRIFICATIONS ---
+#
+# Un même artefact signé est souvent revérifié à l'identique. CachedVerifier
+# mémorise le résultat de verify_digest dans un LRUCache (borné, partageable
+# entre threads, avec durée de vie optionnelle), sous la clé
+# (empreinte de la clé publique, vecteur cible, sigma): une vérification
+# répétée se réduit au hachage du message et à une lecture de dictionnaire.
+
+# Empreintes des clés dict, par objet P: la matrice est gardée avec son empreinte,
+# son id ne peut donc pas être réattribué tant que l'entrée reste dans le cache.
+_dict_fingerprints = LRUCache(16)
+
+def key_fingerprint(keypair):
+    """Empreinte d'une clé publique, égale à UOVKey.fingerprint d'une clé qui stocke la même P.
+
+    Pour un dict (clé des interfaces graphiques), elle est calculée une fois par
+    matrice P puis relue: une vérification répétée ne rehache pas P.
+    """
+    if isinstance(keypair, UOVKey):
+        return keypair.fingerprint
+    P = keypair["P"]
+    entry = _dict_fingerprints.get(id(P))
+    if entry is None or entry[0] is not P:
+        n = keypair["n"]
+        digest = _key_digest(n, keypair["v"], keypair["m"], len(P) == triangular_size(n),
+                             [("P", GFMatrix(P).tobytes())])
+        entry = (P, digest)
+        _dict_fingerprints.put(id(P), entry)
+    return entry[1]
+
+class CachedVerifier:
+    """Verify / verify_digest avec mémorisation des résultats (voir LRUCache)."""
+
+    def __init__(self, maxsize=4096, ttl=None):
+        self.cache = LRUCache(maxsize, ttl)
+
+    def verify(self, keypair, message, sigma, salt=b""):
+        return self.verify_digest(keypair, hash_to_target(message, salt, keypair["m"]), sigma)
+
+    def verify_digest(self, keypair, target, sigma):
+        try:
+            cache_key = (key_fingerprint(keypair), GFVector(target).tobytes(), GFVector(sigma).tobytes())
+        except (TypeError, ValueError, OverflowError):
+            # Signature mal formée: pas de mise en cache, verify_digest signale l'erreur
+            return verify_digest(keypair, target, sigma)
+        ok = self.cache.get(cache_key)
+        if ok is None:
+            ok = verify_digest(keypair, target, sigma)
+            self.cache.put(cache_key, ok)
+        return ok
+
+    def info(self):
+        """Statistiques (hits, misses, size, maxsize, ttl)."""
+        return self.cache.info()
+
+    def clear(self):
+        self.cache.clear()
+
+# --- SIGNATURE EN LIGNE / HORS LIGNE ---
+#
+# Dans une tentative de Sign, seul b dépend du message: les vinaigres xv,
+# F(xv, 0) et A ne dépendent que du hasard. OnlineSigner les prépare à l'avance
+# dans un thread de fond (file bornée de triplets (xv, F(xv, 0), A^-1), A étant
+# déjà connue inversible); la partie en ligne se réduit au hachage, à un produit
+# xo = A^-1 (t - F(xv, 0)) et à l'application de T_inv. Les essais sur des A
+# singulières sont tous faits hors ligne. Chaque triplet ne sert qu'une fois.
+
+class OnlineSigner:
+    """Signature en deux temps: précalculs hors ligne dans un thread, sign() en ligne."""
+
+    def __init__(self, keypair, pool_size=32):
+        if pool_size < 1:
+            raise ValueError("La réserve de précalculs doit contenir au moins un élément.")
+        self.key = prepare_signing_key(keypair)
+        self._pool = queue.Queue(pool_size)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._fill, name="uov-offline", daemon=True)
+        self._thread.start()
+
+    def precompute(self):
+        """Un triplet (xv, F(xv, 0), A^-1) pour des vinaigres tirés au hasard."""
+        sk = self.key
+        while True:
+            xv = GFVector(random_bytes(sk.v))
+            known, A = _vinegar_terms(sk, xv)
+            try:
+                return xv, known, A.inverse()
+            except ValueError:
+                continue # A singulière, on recommence
+
+    def _fill(self):
+        while not self._stop.is_set():
+            item = self.precompute()
+            while not self._stop.is_set():
+                try:
+                    self._pool.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    @property
+    def available(self):
+        """Nombre de précalculs prêts."""
+        return self._pool.qsize()
+
+    def sign(self, message, salt=b""):
+        return self.sign_digest(hash_to_target(message, salt, self.key.m))
+
+    def sign_digest(self, target):
+        try:
+            xv, known, A_inv = self._pool.get_nowait()
+        except queue.Empty:
+            # Réserve épuisée: on précalcule sur place plutôt que d'attendre le thread
+            xv, known, A_inv = self.precompute()
+        xo = A_inv.mat_vec(_as_target(target, self.key.m) - known)
+        return self.key.T_inv.mat_vec(xv.concat(xo)).tolist()
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()